@@ -7,3 +7,46 @@ load_dotenv()
 
 # Acces environment variables
 DATABASE_URL = os.getenv("DEVELOPMENT_DATABASE_URL")
+
+# Directory of raw HTML archive of scraped pages
+ARCHIVE_DIR = os.getenv("ARCHIVE_DIR", "data/archive")
+
+# Scraping mode: live -> download pages | replay -> read pages from archive only
+SCRAPING_MODE = os.getenv("SCRAPING_MODE", "live")
+
+# Scraping rate limit: requests per minute and maximum requests sent at once
+SCRAPING_RATE = float(os.getenv("SCRAPING_RATE", "20"))
+SCRAPING_BURST = int(os.getenv("SCRAPING_BURST", "2"))
+
+# Maximum number of attempts for each page (429 responses)
+SCRAPING_MAX_RETRIES = int(os.getenv("SCRAPING_MAX_RETRIES", "5"))
+
+# Maximum number of pages fetched at once
+SCRAPING_CONCURRENCY = int(os.getenv("SCRAPING_CONCURRENCY", "4"))
+
+# HTTP client settings of scrapers
+SCRAPING_USER_AGENT = os.getenv(
+    "SCRAPING_USER_AGENT", "nhl_analysis (+https://github.com/zwarott/nhl_analysis)"
+)
+SCRAPING_TIMEOUT = float(os.getenv("SCRAPING_TIMEOUT", "30"))
+
+# Team rosters persisted between runs (empty value -> rosters are not persisted)
+# and maximum age of persisted roster in hours
+ROSTER_CACHE_PATH = os.getenv("ROSTER_CACHE_PATH", "data/rosters.json")
+ROSTER_CACHE_MAX_AGE = float(os.getenv("ROSTER_CACHE_MAX_AGE", "24"))
+
+# Current NHL season (year of its end, 2024 -> 2023-24 season)
+NHL_SEASON = int(os.getenv("NHL_SEASON", "2024"))
+
+# Minimum number of rows imported by COPY (smaller imports use ORM objects)
+BULK_LOAD_MIN_ROWS = int(os.getenv("BULK_LOAD_MIN_ROWS", "500"))
+
+# Database connection pool: kept connections, extra connections under load,
+# connection check before use and maximum connection age in seconds
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "true").lower() == "true"
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+
+# Directory of EXPLAIN ANALYZE benchmark results of SQL queries
+BENCHMARK_DIR = os.getenv("BENCHMARK_DIR", "benchmarks")
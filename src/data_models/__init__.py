@@ -1,5 +1,6 @@
 # All table objects below will be imported (used by alembic) within Base.metadata
 from src.data_models.base import Base, game_team_join, game_player_join
 from src.data_models.game import Game 
-from src.data_models.team import Team, TeamStat, TeamStatAdvanced
+from src.data_models.team import Team, TeamGame, TeamStat, TeamStatAdvanced
 from src.data_models.player import Player, SkaterStat, SkaterStatAdvanced, GoalieStat 
+from src.data_models.checkpoint import IngestCheckpoint
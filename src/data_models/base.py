@@ -2,7 +2,7 @@ import datetime
 
 from typing_extensions import Annotated
 
-from sqlalchemy import MetaData, String, ForeignKey, Table, Column, func 
+from sqlalchemy import MetaData, String, ForeignKey, Table, Column, func, text 
 from sqlalchemy.orm import DeclarativeBase, mapped_column
 
 
@@ -24,7 +24,8 @@ timestamp_created = Annotated[
 ]
 timestamp_updated = Annotated[
     datetime.datetime, 
-    mapped_column(onupdate=func.CURRENT_TIMESTAMP(0),
+    # Precision has to be rendered as literal (not as bound parameter)
+    mapped_column(onupdate=text("CURRENT_TIMESTAMP(0)"),
                   nullable=True)
     
 ]
@@ -0,0 +1,19 @@
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.data_models.base import Base
+from src.data_models.base import intpk, intfk_gid
+from src.data_models.base import timestamp_created, timestamp_updated
+
+
+class IngestCheckpoint(Base):
+    __tablename__ = "ingest_checkpoint"
+
+    # Basic info
+    cid: Mapped[intpk]
+    season: Mapped[int]  # Season of the game - 2024 (2023-24 season)
+    link: Mapped[str] = mapped_column(unique=True)  # Boxscore link of the game
+    gid: Mapped[intfk_gid] = mapped_column(index=True)  # Ingested game
+
+    # Record info
+    created: Mapped[timestamp_created]
+    updated: Mapped[timestamp_updated]
@@ -1,6 +1,7 @@
 from __future__ import annotations
 from typing import List, TYPE_CHECKING
 
+from sqlalchemy import Index
 from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import Mapped, relationship
 
@@ -18,6 +19,11 @@ if TYPE_CHECKING:
 
 class Game(Base):
     __tablename__ = "game"
+    # Last-N queries read the latest home/away games of each team
+    __table_args__ = (
+        Index("ix_game_htid_gid", "htid", "gid"),
+        Index("ix_game_atid_gid", "atid", "gid"),
+    )
 
     # Basic information
     gid: Mapped[intpk]
@@ -1,8 +1,9 @@
 from __future__ import annotations
-from typing import List, TYPE_CHECKING
+from typing import List, Optional, TYPE_CHECKING
 from datetime import timedelta
 
-from sqlalchemy.orm import Mapped, relationship
+from sqlalchemy import Index, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.data_models.base import Base
 from src.data_models.base import intpk, intfk_gid, intfk_tid, intfk_pid, str_2
@@ -23,6 +24,8 @@ class Player(Base):
     pid: Mapped[intpk]
     name: Mapped[str]  # Player name
     pos: Mapped[str_2]  # Player position
+    # Player id used by Hockey Reference (/players/a/ahose01.html -> ahose01)
+    slug: Mapped[Optional[str]] = mapped_column(index=True)
 
     # Team info
     tid: Mapped[intfk_tid]
@@ -42,6 +45,13 @@ class Player(Base):
 
 class SkaterStat(Base):
     __tablename__ = "skater_stat"
+    # Each player has a single row per game
+    # Last-N queries read the latest games of each player (index range scan)
+    __table_args__ = (
+        UniqueConstraint("gid", "pid"),
+        Index("ix_skater_stat_pid_gid", "pid", "gid"),
+        Index("ix_skater_stat_tid_gid", "tid", "gid"),
+    )
 
     # Basic info
     sid: Mapped[intpk]
@@ -74,6 +84,11 @@ class SkaterStat(Base):
 
 class GoalieStat(Base):
     __tablename__ = "goalie_stat"
+    # Each player has a single row per game
+    __table_args__ = (
+        UniqueConstraint("gid", "pid"),
+        Index("ix_goalie_stat_pid_gid", "pid", "gid"),
+    )
 
     # Basic info
     sid: Mapped[intpk]
@@ -100,6 +115,11 @@ class GoalieStat(Base):
 
 class SkaterStatAdvanced(Base):
     __tablename__ = "skater_stat_advanced"
+    # Each player has a single row per game
+    __table_args__ = (
+        UniqueConstraint("gid", "pid"),
+        Index("ix_skater_stat_advanced_pid_gid", "pid", "gid"),
+    )
 
     # Basic info
     sid: Mapped[intpk]
@@ -1,6 +1,8 @@
 from __future__ import annotations
-from typing import List, TYPE_CHECKING
+import datetime
+from typing import List, Optional, TYPE_CHECKING
 
+from sqlalchemy import Index, UniqueConstraint
 from sqlalchemy.orm import Mapped, relationship
 
 from src.data_models.base import Base
@@ -36,8 +38,44 @@ class Team(Base):
     updated: Mapped[timestamp_updated]
 
 
+class TeamGame(Base):
+    __tablename__ = "team_game"
+    # Each team has a single row per game (home and away team)
+    # Last-N queries read the latest games of each team (index range scan)
+    __table_args__ = (
+        UniqueConstraint("gid", "tid"),
+        Index("ix_team_game_tid_date_gid", "tid", "date", "gid"),
+    )
+
+    # Basic info
+    tgid: Mapped[intpk]
+    tid: Mapped[intfk_tid]
+    gid: Mapped[intfk_gid]
+    date: Mapped[datetime.date]
+
+    # Game from the team point of view
+    is_home: Mapped[bool]  # Home team
+    opp_tid: Mapped[intfk_tid]  # Opponent team
+    gf: Mapped[int]  # Goals For
+    ga: Mapped[int]  # Goals Against
+    # W - win | L - loss | OTL - loss in overtime or shootout
+    result: Mapped[str_3]
+    # Days since previous game of the team (None for the first stored game)
+    rest_days: Mapped[Optional[int]]
+
+    # Record info
+    created: Mapped[timestamp_created]
+    updated: Mapped[timestamp_updated]
+
+
 class TeamStat(Base):
     __tablename__ = "team_stat"
+    # Each team has a single row per game
+    # Last-N queries read the latest games of each team (index range scan)
+    __table_args__ = (
+        UniqueConstraint("gid", "tid"),
+        Index("ix_team_stat_tid_gid", "tid", "gid"),
+    )
 
     # Basic info
     sid: Mapped[intpk]
@@ -62,6 +100,11 @@ class TeamStat(Base):
 
 class TeamStatAdvanced(Base):
     __tablename__ = "team_stat_advanced"
+    # Each team has a single row per game
+    __table_args__ = (
+        UniqueConstraint("gid", "tid"),
+        Index("ix_team_stat_advanced_tid_gid", "tid", "gid"),
+    )
 
     # Basic info
     sid: Mapped[intpk]
@@ -0,0 +1,143 @@
+import gzip
+import hashlib
+import json
+import os
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Union
+
+
+class PageArchive:
+    """Content-addressed archive of raw HTML pages.
+
+    Each page is stored only once as a gzip compressed file named by
+    SHA-256 hash of its content. Index file (JSON lines) records which
+    page content was fetched from which URL and when.
+
+    Parameters
+    ----------
+    directory: Union[str, Path]
+        Directory of the archive.
+    """
+
+    def __init__(self, directory: Union[str, Path]) -> None:
+        self.directory = Path(directory)
+        self.objects_dir = self.directory / "objects"
+        self.index_path = self.directory / "index.jsonl"
+
+        # Index loaded from index file (url: list of (fetched, digest))
+        self._index = None
+        self._lock = threading.Lock()
+
+    def _object_path(self, digest: str) -> Path:
+        # Split objects into subdirectories by first 2 characters of hash
+        return self.objects_dir / digest[:2] / f"{digest}.html.gz"
+
+    def _load_index(self) -> dict:
+        if self._index is None:
+            self._index = {}
+            if self.index_path.exists():
+                with open(self.index_path, encoding="utf-8") as index_file:
+                    for line in index_file:
+                        record = json.loads(line)
+                        self._index.setdefault(record["url"], []).append(
+                            (record["fetched"], record["sha256"])
+                        )
+        return self._index
+
+    def store(
+        self, url: str, html: str, fetched: Union[datetime, None] = None
+    ) -> str:
+        """Store fetched page into archive.
+
+        Parameters
+        ----------
+        url: str
+            A string representing URL of fetched page.
+        html: str
+            A string representing raw HTML of fetched page.
+        fetched: Union[datetime, None] = None
+            Fetch time of the page. If value is not specified, default
+            value is None -> current time is used.
+
+        Returns
+        -------
+        str
+            A string representing SHA-256 hash of page content.
+        """
+        content = html.encode("utf-8")
+        digest = hashlib.sha256(content).hexdigest()
+        fetched = (fetched or datetime.now()).isoformat(timespec="seconds")
+
+        with self._lock:
+            # Content is written only if it is not archived yet
+            object_path = self._object_path(digest)
+            if not object_path.exists():
+                object_path.parent.mkdir(parents=True, exist_ok=True)
+                # Write into temporary file first, so interrupted write
+                # never leaves broken object in archive
+                tmp_path = object_path.with_suffix(".tmp")
+                with gzip.open(tmp_path, "wb") as object_file:
+                    object_file.write(content)
+                os.replace(tmp_path, object_path)
+
+            index = self._load_index()
+            with open(self.index_path, "a", encoding="utf-8") as index_file:
+                record = {"url": url, "fetched": fetched, "sha256": digest}
+                index_file.write(json.dumps(record) + "\n")
+            index.setdefault(url, []).append((fetched, digest))
+
+        return digest
+
+    def load(self, digest: str) -> str:
+        """Load archived page content by its hash.
+
+        Parameters
+        ----------
+        digest: str
+            A string representing SHA-256 hash of page content.
+
+        Returns
+        -------
+        str
+            A string representing raw HTML of archived page.
+        """
+        with gzip.open(self._object_path(digest), "rb") as object_file:
+            return object_file.read().decode("utf-8")
+
+    def fetches(self, url: str) -> list:
+        """All archived fetches of selected URL.
+
+        Parameters
+        ----------
+        url: str
+            A string representing URL of fetched page.
+
+        Returns
+        -------
+        list
+            A list of (fetched, digest) tuples sorted by fetch time.
+        """
+        with self._lock:
+            return sorted(self._load_index().get(url, []))
+
+    def latest(self, url: str) -> Union[str, None]:
+        """Latest archived content of selected URL.
+
+        Parameters
+        ----------
+        url: str
+            A string representing URL of fetched page.
+
+        Returns
+        -------
+        Union[str, None]
+            A string representing raw HTML of the latest fetch or None,
+            if URL was never archived.
+        """
+        fetches = self.fetches(url)
+        if not fetches:
+            return None
+
+        return self.load(fetches[-1][1])
@@ -0,0 +1,122 @@
+from typing import Iterator, Union
+
+from src.data_preprocessing.fetch import fetch_html
+from src.data_preprocessing.html_tables import HtmlTable, extract_tables
+from src.data_preprocessing.pipeline import prefetch
+
+
+class BoxscorePage:
+    """Boxscore page of a single game.
+
+    Boxscore page is fetched and parsed only once. Only tables used
+    by team and player stats scrapers are parsed, they are selected
+    by their HTML ids (e.g. BOS_skaters, BOS_goalies, BOS_adv_ALLAll).
+
+    Parameters
+    ----------
+    link: str
+        A string representing link of game boxscore page.
+    html: Union[str, None] = None
+        A string representing raw HTML of the page. If value is not
+        specified, default value is None -> page is fetched.
+    """
+
+    # HTML ids of tables used by scrapers (team abbreviation + table name)
+    # skaters -> basic skater stats | goalies -> basic goalie stats
+    # adv_ALLAll -> advanced skater stats in all situations
+    table_names = ("skaters", "goalies", "adv_ALLAll")
+    id_pattern = r"[A-Z]{3}_(skaters|goalies|adv_ALLAll)"
+
+    def __init__(self, link: str, html: Union[str, None] = None) -> None:
+        self.link = link
+
+        if html is None:
+            html = fetch_html(link)
+
+        # Away team tables precede home team tables on the page
+        self.tables = {name: [] for name in self.table_names}
+        for table in extract_tables(html, self.id_pattern):
+            self.tables[table.table_id[4:]].append(table)
+
+        for name, tables in self.tables.items():
+            if len(tables) != 2:
+                raise LookupError(
+                    f"Expected 2 '{name}' tables, found {len(tables)} on {link}."
+                )
+
+    def table(self, name: str, home: bool) -> HtmlTable:
+        """Table from boxscore page.
+
+        Parameters
+        ----------
+        name: str
+            A string representing table name (skaters, goalies, adv_ALLAll).
+        home: bool
+            True for home team table, False for away team table.
+
+        Returns
+        -------
+        HtmlTable
+            Table with typed column arrays.
+        """
+        return self.tables[name][int(home)]
+
+
+# Boxscore pages downloaded within current run (link: BoxscorePage)
+_boxscore_pages = {}
+
+
+def boxscore_page(link: str) -> BoxscorePage:
+    """Get boxscore page of a single game.
+
+    Boxscore page is downloaded only if it was not downloaded within
+    current run yet. Otherwise, already parsed page is returned.
+
+    Parameters
+    ----------
+    link: str
+        A string representing link of game boxscore page.
+
+    Returns
+    -------
+    BoxscorePage
+        Parsed boxscore page shared by all team and player stats scrapers.
+    """
+    page = _boxscore_pages.get(link)
+
+    if page is None:
+        page = BoxscorePage(link)
+        _boxscore_pages[link] = page
+
+    return page
+
+
+def prefetch_boxscore_pages(
+    links: list, cache: bool = True
+) -> Iterator[BoxscorePage]:
+    """Boxscore pages of selected games fetched in advance.
+
+    Following pages are fetched in background while already fetched
+    page is processed.
+
+    Parameters
+    ----------
+    links: list
+        A list of links of game boxscore pages.
+    cache: bool = True
+        If True, pages are kept for other scrapers within current run.
+        Otherwise, each page is released once it is processed (e.g.
+        backfill of whole seasons visits each page only once).
+
+    Yields
+    ------
+    BoxscorePage
+        Parsed boxscore pages in the same order as links.
+    """
+    for _, page in prefetch(links, boxscore_page if cache else BoxscorePage):
+        yield page
+
+
+def clear_boxscore_pages() -> None:
+    """Remove all boxscore pages downloaded within current run."""
+    _boxscore_pages.clear()
@@ -0,0 +1,102 @@
+from io import StringIO
+
+from config import ARCHIVE_DIR, SCRAPING_MODE, SCRAPING_MAX_RETRIES
+from src.logging_setup import logger
+from src.data_preprocessing.archive import PageArchive
+from src.data_preprocessing.rate_limiter import scheduler, parse_retry_after
+from src.data_preprocessing.http_client import client
+
+
+# Archive of all fetched pages
+archive = PageArchive(ARCHIVE_DIR)
+
+# Scraping mode: live -> download pages | replay -> read pages from archive only
+scraping_mode = {"mode": SCRAPING_MODE}
+
+
+def set_scraping_mode(mode: str) -> None:
+    """Set up scraping mode for all scrapers.
+
+    Parameters
+    ----------
+    mode: str
+        A string representing scraping mode. If mode is 'live', pages
+        are downloaded and archived. If mode is 'replay', pages are read
+        from archive without touching the network.
+    """
+    if mode not in ("live", "replay"):
+        raise ValueError(f"Unknown scraping mode: {mode}")
+
+    scraping_mode["mode"] = mode
+
+
+def fetch_html(url: str) -> str:
+    """Fetch raw HTML of a page.
+
+    In live mode, page is downloaded and stored into archive. In replay
+    mode, the latest archived version of the page is returned.
+
+    Parameters
+    ----------
+    url: str
+        A string representing URL of the page.
+
+    Returns
+    -------
+    str
+        A string representing raw HTML of the page.
+    """
+    if scraping_mode["mode"] == "replay":
+        html = archive.latest(url)
+        if html is None:
+            raise LookupError(f"Page {url} is not archived.")
+        return html
+
+    for attempt in range(1, SCRAPING_MAX_RETRIES + 1):
+        # Wait for free slot of shared rate limiter
+        scheduler.acquire()
+
+        # Shared client reuses connections and accepts compressed responses
+        response = client.get(url)
+
+        # Too many requests -> slow down and try again after Retry-After
+        if response.status_code == 429:
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            logger.warning(
+                f"Got 429 for {url} ({attempt}/{SCRAPING_MAX_RETRIES}), Retry-After: {retry_after} seconds."
+            )
+            scheduler.backoff(retry_after)
+            continue
+
+        break
+
+    # Raise an error for unsuccessful response (including last 429)
+    response.raise_for_status()
+    scheduler.success()
+    html = response.text
+
+    # Store each downloaded page for further replays
+    archive.store(url, html)
+
+    return html
+
+
+def read_html(url: str, **kwargs) -> list:
+    """Read HTML tables of a page.
+
+    Parameters
+    ----------
+    url: str
+        A string representing URL of the page.
+    **kwargs
+        Keyword arguments passed into pd.read_html().
+
+    Returns
+    -------
+    list
+        A list of pandas DataFrames, one for each table of the page.
+    """
+    # pandas is imported only when needed (fetching raw pages does not need it)
+    import pandas as pd
+
+    return pd.read_html(StringIO(fetch_html(url)), **kwargs)
@@ -1,22 +1,63 @@
+import datetime
+from typing import Type, Union
+
 import pandas as pd
 import numpy as np
 
-from sqlalchemy import select, desc
+from sqlalchemy import select, exists, or_
 
+from config import NHL_SEASON
+from src.logging_setup import logger
 from src.session_config import Sess
+from src.data_preprocessing.fetch import read_html
+from src.data_preprocessing.team_registry import team_registry
 
 from src.data_models.nhl_teams import teams_dict
 from src.data_models.game import Game
-from src.data_models.team import Team
+from src.data_models.base import Base
+from src.data_models.team import Team, TeamStat, TeamStatAdvanced
+from src.data_models.player import SkaterStat, SkaterStatAdvanced, GoalieStat
+from src.data_models.checkpoint import IngestCheckpoint
+
+
+# Stat tables populated from boxscore pages
+STAT_TABLES = (TeamStat, TeamStatAdvanced, SkaterStat, SkaterStatAdvanced, GoalieStat)
+
 
+def season_of(date: Union[datetime.date, str]) -> int:
+    """Season of the game date by the year of its end.
 
-def games_played() -> pd.DataFrame:
+    Season starts in October, so games played since August belong to
+    the season ending the next year (2023-10-10 -> 2024).
+
+    Parameters
+    ----------
+    date: Union[datetime.date, str]
+        Game date (date object, YYYY-MM-DD or YYYYMMDD).
+
+    Returns
+    -------
+    int
+        An integer representing season by the year of its end.
+    """
+    date = str(date).replace("-", "")
+    year, month = int(date[:4]), int(date[4:6])
+    return year + 1 if month >= 8 else year
+
+
+def games_played(season: int = NHL_SEASON) -> pd.DataFrame:
     """Scrape all games played.
 
     Scrape all NHL games played in order to populate empty database table.
     After that filter games played only, fill missing data and rename order
     drop selected columns.
 
+    Parameters
+    ----------
+    season: int = NHL_SEASON
+        An integer representing season by the year of its end (2024 ->
+        2023-24 season). If value is not specified, current season is used.
+
     Returns
     -------
     pd.DataFrame
@@ -24,12 +65,12 @@ def games_played() -> pd.DataFrame:
     """
 
     # Link from scraping game data
-    link = "https://www.hockey-reference.com/leagues/NHL_2024_games.html"
+    link = f"https://www.hockey-reference.com/leagues/NHL_{season}_games.html"
 
     # Create DataFrame with games results
     # 0 -> Regular Season results
     # 1 Playoffs Results
-    df_all_games = pd.read_html(link)[1]
+    df_all_games = read_html(link)[1]
 
     # Rename column names
     old_cols = ["Date", "Visitor", "G", "Home", "G.1", "Unnamed: 5"]
@@ -54,19 +95,12 @@ def games_played() -> pd.DataFrame:
     # Replace null values in end column with FT (fulltime)
     df_filtered["end"] = df_filtered["end"].replace(np.nan, "FT")
 
-    # Construct Session with begin() method for handling each transaction
-    # The transaction is automatically committed or rolled back when exiting the 'with' block
-    with Sess.begin() as session:
-        # Query the database for team names and corresponding primary keys
-        stmt = select(Team.abbr, Team.tid)
-        team_data = session.execute(stmt)
-
-        # Create a dictionary mapping team names to primary keys
-        team_mapping = {abbr: tid for abbr, tid in team_data}
+    # Dictionary mapping team abbreviations to primary keys (team registry)
+    team_mapping = team_registry.tid_mapping()
 
-        # Update the DataFrame's foreing key columns based on the team names
-        df_filtered["atid"] = df_filtered["visitor"].map(team_mapping)
-        df_filtered["htid"] = df_filtered["home"].map(team_mapping)
+    # Update the DataFrame's foreing key columns based on the team names
+    df_filtered["atid"] = df_filtered["visitor"].map(team_mapping)
+    df_filtered["htid"] = df_filtered["home"].map(team_mapping)
 
     # Drop team name columns when foreign keys column is populated
     df_filtered.drop(columns=["visitor", "home"], inplace=True)
@@ -74,31 +108,167 @@ def games_played() -> pd.DataFrame:
     return df_filtered
 
 
-def games_last():
-    """Scrape lastest game data that are not within database.
+def plan_season(season: int) -> pd.DataFrame:
+    """Plan games of a single season that are not ingested yet.
+
+    Games with a checkpoint (ingested by previous runs) are skipped, as
+    well as games already stored without a checkpoint (ingested before
+    checkpoints were introduced). Games of teams missing in Team table
+    (e.g. relocated franchises) are skipped with a warning.
+
+    Parameters
+    ----------
+    season: int
+        An integer representing season by the year of its end.
 
     Returns
     -------
     pd.DataFrame
-        Pandas DataFrame that represents lastest game data.
+        Pandas DataFrame with games to be ingested (same columns as
+        games_played() returns).
     """
+    df_games = games_played(season)
+
+    # Games with unknown teams cannot be stored (tid is required)
+    unknown = df_games["atid"].isna() | df_games["htid"].isna()
+    if unknown.any():
+        logger.warning(
+            f"Season {season}: skipping {unknown.sum()} games of teams missing in Team table."
+        )
+        df_games = df_games[~unknown].astype({"atid": int, "htid": int})
 
-    # All games played
-    all_games_played = games_played()
+    if df_games.empty:
+        return df_games
 
-    # Select last game date from Game object
     with Sess.begin() as session:
-        stmt = select(Game.date).order_by(desc("date")).limit(1)
+        # Boxscore links of games ingested by previous runs
+        done_links = set(
+            session.scalars(
+                select(IngestCheckpoint.link).where(IngestCheckpoint.season == season)
+            ).all()
+        )
+
+        # Games stored without a checkpoint (date, home team)
+        stmt = select(Game.date, Game.htid).where(
+            Game.date.between(df_games["date"].min(), df_games["date"].max())
+        )
+        stored_games = {
+            (str(date), htid) for date, htid in session.execute(stmt).all()
+        }
+
+    links = [
+        boxscore_link(str(date).replace("-", ""), team_registry.abbr(htid))
+        for date, htid in zip(df_games["date"], df_games["htid"])
+    ]
+    pending = [
+        link not in done_links and (str(date), htid) not in stored_games
+        for link, date, htid in zip(links, df_games["date"], df_games["htid"])
+    ]
 
-        # Prepare above_date variable for query purposes within
-        # pandas DataFrame
-        above_date = session.execute(stmt).scalars().first()
-        above_date = str(above_date)
+    return df_games[pending]
 
-    # Filter last games played only
-    df_last_games = all_games_played.query("date > @above_date")
 
-    return df_last_games
+def games_last() -> pd.DataFrame:
+    """Scrape games of current season that are not within database.
+
+    Games are selected by anti-join against stored games and ingest
+    checkpoints (not by the date of the last stored game), so games of
+    a date left unfinished by an interrupted run are ingested by the
+    next run.
+
+    Returns
+    -------
+    pd.DataFrame
+        Pandas DataFrame that represents games to be ingested.
+    """
+    return plan_season(NHL_SEASON)
+
+
+class GameIndex:
+    """In-memory index of games stored in database.
+
+    Game⋈Team join is loaded only once per run, games ingested later
+    within the run are added into the index. Each game is accessible
+    by gid or boxscore link in O(1).
+    """
+
+    def __init__(self) -> None:
+        # gid: [gid, date as YYYYMMDD, atid, htid, abbr of home team]
+        self.games = {}
+        # gid: boxscore link | boxscore link: gid
+        self.links = {}
+        self.gids = {}
+        self.loaded = False
+
+    def _load(self) -> None:
+        if self.loaded:
+            return
+
+        with Sess.begin() as session:
+            stmt = select(Game.gid, Game.date, Game.atid, Game.htid, Team.abbr).join(
+                Team, Team.tid == Game.htid
+            )
+            for gid, date, atid, htid, abbr in session.execute(stmt).all():
+                self.add(gid, date, atid, htid, abbr)
+
+        self.loaded = True
+
+    def add(
+        self, gid: int, date: Union[datetime.date, str], atid: int, htid: int, abbr: str
+    ) -> None:
+        """Add a single game into the index.
+
+        Parameters
+        ----------
+        gid: int
+            An integer representing unique game identifier.
+        date: Union[datetime.date, str]
+            Game date as date object or string in format YYYY-MM-DD.
+        atid: int
+            An integer representing unique identifier of away team.
+        htid: int
+            An integer representing unique identifier of home team.
+        abbr: str
+            A string representing abbreviation of home team.
+        """
+        # Remove dashes from game date
+        date = str(date).replace("-", "")
+        link = boxscore_link(date, abbr)
+
+        self.games[gid] = [gid, date, atid, htid, abbr]
+        self.links[gid] = link
+        self.gids[link] = gid
+
+    def game(self, gid: int) -> list:
+        """Game data (gid, date as YYYYMMDD, atid, htid, abbr of home team)."""
+        self._load()
+        return self.games[gid]
+
+    def link(self, gid: int) -> str:
+        """Boxscore link of the game."""
+        self._load()
+        return self.links[gid]
+
+    def gid(self, link: str) -> int:
+        """Game identifier of the boxscore link."""
+        self._load()
+        return self.gids[link]
+
+    def rows(self) -> list:
+        """Data of all games ordered by gid."""
+        self._load()
+        return [list(self.games[gid]) for gid in sorted(self.games)]
+
+    def clear(self) -> None:
+        """Remove all games, the index is loaded again when needed."""
+        self.games.clear()
+        self.links.clear()
+        self.gids.clear()
+        self.loaded = False
+
+
+# Index of games shared by all scrapers within the process
+game_index = GameIndex()
 
 
 def scraping_data() -> list:
@@ -114,24 +284,77 @@ def scraping_data() -> list:
     list
         List representing simplified data for further scraping.
     """
+    # Indexes: 0-gid, 1-date, 2-atid, 3-htid, 4-htid abbr
+    return game_index.rows()
+
+
+def missing_games(
+    class_obj: Union[Type[Base], None] = None, num_games: Union[int, None] = None
+) -> list:
+    """Games still missing rows in stat tables.
+
+    Games are selected by anti-join (NOT EXISTS) on indexed gid column
+    of stat tables, so games inserted out of order or gaps in gid values
+    do not matter. Games with a checkpoint (ingested or filled in with
+    all stats their boxscore page has) are skipped.
+
+    Parameters
+    ----------
+    class_obj: Union[Type[Base], None] = None
+        Class object of stat table. If value is not specified, default
+        value is None -> games missing rows in any of stat tables.
+    num_games: Union[int, None] = None
+        An integer representing maximum number of selected games. If
+        value is not specified, default value is None -> all missing
+        games.
+
+    Returns
+    -------
+    list
+        List of games ordered by gid, each row is a list in the same
+        format as scraping_data() returns (gid, date as YYYYMMDD, atid,
+        htid, abbr of home team).
+    """
+    stat_tables = (class_obj,) if class_obj is not None else STAT_TABLES
+
+    # Game is missing if any of selected stat tables has no row with its gid
+    missing = or_(
+        *(~exists().where(stat_table.gid == Game.gid) for stat_table in stat_tables)
+    )
+
+    done = exists().where(IngestCheckpoint.gid == Game.gid)
+
+    stmt = (
+        select(Game.gid, Game.date, Game.atid, Game.htid, Team.abbr)
+        .join(Team, Team.tid == Game.htid)
+        .where(missing, ~done)
+        .order_by(Game.gid)
+        .limit(num_games)
+    )
+
     with Sess.begin() as session:
-        stmt = select(Game.gid, Game.date, Game.atid, Game.htid, Team.abbr).join(
-            Team, Team.tid == Game.htid
-        )
+        return [
+            [gid, date.strftime("%Y%m%d"), atid, htid, abbr]
+            for gid, date, atid, htid, abbr in session.execute(stmt).all()
+        ]
 
-        # Select all games played with joined abbreviations of home teams
-        games_played = session.execute(stmt).all()
 
-        # Remove dashes from game dates and each row converts to list and
-        # append it to empty list
-        modified_data = []
-        for row in games_played:
-            modified_row = list(row)
-            # Index number 1 is position of date column value
-            modified_row[1] = modified_row[1].strftime("%Y%m%d")
-            modified_data.append(modified_row)
+def boxscore_link(date: str, abbr: str) -> str:
+    """Link of game boxscore page.
 
-        return modified_data
+    Parameters
+    ----------
+    date: str
+        A string representing game date in format YYYYMMDD.
+    abbr: str
+        A string representing abbreviation of home team.
+
+    Returns
+    -------
+    str
+        A string representing link of game boxscore page.
+    """
+    return f"https://www.hockey-reference.com/boxscores/{date}0{abbr}.html"
 
 
 def scraping_links() -> list:
@@ -143,16 +366,7 @@ def scraping_links() -> list:
     -------
     List
         A list representing links of each game played for further
-        data scraping such as team and player stats.
+        data scraping such as team and player stats. There is exactly
+        one link per game, in the same order as scraping_data() returns.
     """
-    # Indexes: 0-gid, 1-date, 2-atid, 3-htid, 4-htid abbr
-    df_all_games = scraping_data()
-
-    # List for each game link
-    links = []
-    for i in range(len(df_all_games)):
-        for df_all_games[i] in df_all_games:
-            link = "https://www.hockey-reference.com/boxscores/"
-            links.append(f"{link}{df_all_games[i][1]}0{df_all_games[i][4]}.html")
-
-    return links
+    return [game_index.link(row[0]) for row in game_index.rows()]
@@ -0,0 +1,205 @@
+import re
+from typing import Union
+
+from lxml import etree, html as lxml_html
+
+
+# Patterns of numeric cell values
+INT_PATTERN = re.compile(r"^[+-]?\d+$")
+FLOAT_PATTERN = re.compile(r"^[+-]?(\d+\.\d*|\.\d+)$")
+
+# Pattern of player page link (/players/a/ahose01.html)
+PLAYER_LINK_PATTERN = re.compile(r"/players/[a-z]/([^/]+)\.html$")
+
+
+class HtmlTable:
+    """Table extracted from HTML page.
+
+    Values are stored as typed column arrays. Integer and float columns
+    are converted into Python numbers, empty cells are None.
+
+    Parameters
+    ----------
+    table_id: str
+        A string representing HTML id of the table.
+    columns: list
+        A list of column names (last header row).
+    rows: list
+        A list of body rows, each row is a list of cell texts.
+    footer: list
+        A list of cell texts of footer row (e.g. team totals).
+    links: Union[list, None] = None
+        A list of the first link (href) of each body row, None if row
+        has no link (e.g. link of player page). If value is not
+        specified, default value is None -> no row has a link.
+    """
+
+    def __init__(
+        self,
+        table_id: str,
+        columns: list,
+        rows: list,
+        footer: list,
+        links: Union[list, None] = None,
+    ) -> None:
+        self.table_id = table_id
+        self.columns = columns
+        self.links = links if links is not None else [None] * len(rows)
+        # Transpose rows into typed column arrays
+        self.values = [
+            convert_column([row[i] if i < len(row) else "" for row in rows])
+            for i in range(len(columns))
+        ]
+        self.footer = convert_row(footer)
+
+    def __len__(self) -> int:
+        return len(self.values[0]) if self.values else 0
+
+    def column(self, name: str) -> list:
+        """Values of the first column with selected name.
+
+        Parameters
+        ----------
+        name: str
+            A string representing column name.
+
+        Returns
+        -------
+        list
+            A list of typed column values.
+        """
+        return self.values[self.columns.index(name)]
+
+    def rows(self) -> list:
+        """Typed values of table rows.
+
+        Returns
+        -------
+        list
+            A list of rows, each row is a list of typed values.
+        """
+        return [list(row) for row in zip(*self.values)]
+
+
+def player_slug(link: Union[str, None]) -> Union[str, None]:
+    """Player id from player page link (/players/a/ahose01.html -> ahose01)."""
+    match = PLAYER_LINK_PATTERN.search(link or "")
+    return match.group(1) if match else None
+
+
+def convert_value(value: str) -> Union[int, float, str, None]:
+    """Convert cell text into Python number, string or None (empty cell)."""
+    if value == "":
+        return None
+    if INT_PATTERN.match(value):
+        return int(value)
+    if FLOAT_PATTERN.match(value):
+        return float(value)
+    return value
+
+
+def convert_row(values: list) -> list:
+    """Convert cell texts of a single row."""
+    return [convert_value(value) for value in values]
+
+
+def convert_column(values: list) -> list:
+    """Convert cell texts of a single column into typed array.
+
+    Column is converted into integers or floats only if all non-empty
+    cells are numeric, otherwise it stays as strings.
+    """
+    converted = convert_row(values)
+    filled = [value for value in converted if value is not None]
+
+    if filled and all(isinstance(value, int) for value in filled):
+        return converted
+    if filled and all(isinstance(value, (int, float)) for value in filled):
+        return [float(value) if value is not None else None for value in converted]
+    # Text column keeps original cell texts, empty cells are None
+    return [None if value == "" else value for value in values]
+
+
+def row_cells(row: etree._Element) -> list:
+    """Cell texts of a table row, cells spanning more columns are repeated."""
+    cells = []
+    for cell in row.xpath("./th|./td"):
+        text = cell.text_content().strip()
+        cells.extend([text] * int(cell.get("colspan", 1)))
+    return cells
+
+
+def parse_table(table: etree._Element) -> HtmlTable:
+    """Parse table element into HtmlTable.
+
+    Parameters
+    ----------
+    table: etree._Element
+        Table element of parsed HTML page.
+
+    Returns
+    -------
+    HtmlTable
+        Table with typed column arrays.
+    """
+    # Last header row holds column names (first ones are group headers)
+    header_rows = table.xpath("./thead/tr")
+    columns = row_cells(header_rows[-1]) if header_rows else []
+
+    # Skip repeated header rows and spacers within table body
+    rows = []
+    links = []
+    for row in table.xpath("./tbody/tr|./tr"):
+        row_class = row.get("class", "")
+        if "thead" in row_class or "over_header" in row_class or "spacer" in row_class:
+            continue
+        rows.append(row_cells(row))
+        # The first link of the row (e.g. player page)
+        hrefs = row.xpath(".//a/@href")
+        links.append(hrefs[0] if hrefs else None)
+
+    footer_rows = table.xpath("./tfoot/tr")
+    footer = row_cells(footer_rows[0]) if footer_rows else []
+
+    return HtmlTable(table.get("id"), columns, rows, footer, links)
+
+
+def extract_tables(page_html: str, id_pattern: str) -> list:
+    """Extract tables with matching HTML id from a page.
+
+    Tables hidden inside HTML comments (rendered by JavaScript on the
+    website) are extracted as well. Other tables are not parsed at all.
+
+    Parameters
+    ----------
+    page_html: str
+        A string representing raw HTML of the page.
+    id_pattern: str
+        A regular expression, that has to match whole table id.
+
+    Returns
+    -------
+    list
+        A list of HtmlTable objects in the same order as on the page.
+    """
+    pattern = re.compile(id_pattern)
+    document = lxml_html.fromstring(page_html)
+
+    tables = []
+    # Iterate over elements and comments in document order
+    for element in document.iter("table", etree.Comment):
+        if element.tag is etree.Comment:
+            # Parse commented HTML only if it contains a table
+            if element.text and "<table" in element.text:
+                fragment = lxml_html.fragment_fromstring(
+                    element.text, create_parent="div"
+                )
+                tables.extend(
+                    parse_table(table)
+                    for table in fragment.iter("table")
+                    if pattern.fullmatch(table.get("id", ""))
+                )
+        elif pattern.fullmatch(element.get("id", "")):
+            tables.append(parse_table(element))
+
+    return tables
@@ -0,0 +1,114 @@
+import threading
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from config import SCRAPING_CONCURRENCY, SCRAPING_TIMEOUT, SCRAPING_USER_AGENT
+from src.logging_setup import logger
+
+
+# Brotli compressed responses are decoded only if brotli package is installed
+try:
+    import brotli  # noqa: F401
+
+    ACCEPT_ENCODING = "gzip, deflate, br"
+except ImportError:
+    ACCEPT_ENCODING = "gzip, deflate"
+
+
+class HttpClient:
+    """Pooled HTTP client shared by all scrapers.
+
+    Single session keeps TLS connections alive between requests,
+    sends User-Agent header and accepts compressed responses. Latency
+    and byte counts of each request are logged and summed up.
+
+    Parameters
+    ----------
+    user_agent: str
+        A string representing User-Agent header of all requests.
+    pool_size: int
+        An integer representing maximum number of kept connections.
+    timeout: float
+        A float representing request timeout in seconds.
+    """
+
+    def __init__(self, user_agent: str, pool_size: int, timeout: float) -> None:
+        self.timeout = timeout
+        self.session = requests.Session()
+        self.session.headers.update(
+            {"User-Agent": user_agent, "Accept-Encoding": ACCEPT_ENCODING}
+        )
+
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        # Totals of all requests
+        self.requests = 0
+        self.seconds = 0.0
+        self.wire_bytes = 0
+        self.content_bytes = 0
+        self._lock = threading.Lock()
+
+    def get(self, url: str) -> requests.Response:
+        """Send GET request.
+
+        Parameters
+        ----------
+        url: str
+            A string representing requested URL.
+
+        Returns
+        -------
+        requests.Response
+            Response with decoded (decompressed) content.
+        """
+        start = time.perf_counter()
+        response = self.session.get(url, timeout=self.timeout)
+        seconds = time.perf_counter() - start
+
+        # Content-Length is size of compressed body, content is decoded body
+        content_bytes = len(response.content)
+        wire_bytes = int(response.headers.get("Content-Length", content_bytes))
+
+        with self._lock:
+            self.requests += 1
+            self.seconds += seconds
+            self.wire_bytes += wire_bytes
+            self.content_bytes += content_bytes
+
+        logger.info(
+            f"GET {url} -> {response.status_code} in {seconds:.2f} s | {wire_bytes} bytes transferred ({content_bytes} bytes decoded)"
+        )
+
+        return response
+
+    def stats(self) -> dict:
+        """Totals of all requests sent by the client.
+
+        Returns
+        -------
+        dict
+            A dictionary with number of requests, total and average
+            latency in seconds, transferred and decoded bytes.
+        """
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "seconds": round(self.seconds, 2),
+                "avg_seconds": round(self.seconds / self.requests, 2)
+                if self.requests
+                else 0.0,
+                "wire_bytes": self.wire_bytes,
+                "content_bytes": self.content_bytes,
+            }
+
+
+# Client shared by all scrapers within the process
+client = HttpClient(
+    user_agent=SCRAPING_USER_AGENT,
+    pool_size=SCRAPING_CONCURRENCY,
+    timeout=SCRAPING_TIMEOUT,
+)
@@ -0,0 +1,114 @@
+import asyncio
+import queue
+import threading
+from collections import deque
+from typing import Callable, Iterable, Iterator, Union
+
+from config import SCRAPING_CONCURRENCY
+
+
+# Marker of the end of fetched items
+_END = object()
+
+
+async def _deliver(entry: tuple, results: queue.Queue) -> None:
+    item, task = entry
+    try:
+        result = await task
+    except Exception as error:
+        # Error is raised later within consumer's thread
+        await asyncio.to_thread(results.put, (item, None, error))
+    else:
+        await asyncio.to_thread(results.put, (item, result, None))
+
+
+async def _produce(
+    items: Iterable,
+    fetch: Callable,
+    results: queue.Queue,
+    concurrency: int,
+    stop: threading.Event,
+) -> None:
+    # Bound number of fetches running at once
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def fetch_item(item):
+        async with semaphore:
+            # Blocking fetch (rate limiter, network, parsing) runs in a thread
+            return await asyncio.to_thread(fetch, item)
+
+    # Fetches are started in order and delivered in the same order
+    pending = deque()
+    try:
+        for item in items:
+            if stop.is_set():
+                break
+            pending.append((item, asyncio.create_task(fetch_item(item))))
+
+            # Keep limited number of items fetched in advance
+            if len(pending) >= concurrency:
+                await _deliver(pending.popleft(), results)
+
+        while pending and not stop.is_set():
+            await _deliver(pending.popleft(), results)
+    finally:
+        for _, task in pending:
+            task.cancel()
+        await asyncio.to_thread(results.put, _END)
+
+
+def prefetch(
+    items: Iterable, fetch: Callable, concurrency: Union[int, None] = None
+) -> Iterator[tuple]:
+    """Fetch items in advance and yield them in order.
+
+    Items are fetched by asyncio event loop running in background
+    thread and passed through a bounded queue. Following items are
+    fetched (waiting on rate limiter and network) while already
+    fetched item is processed by the caller (parsing, DB work).
+
+    Parameters
+    ----------
+    items: Iterable
+        Items to be fetched (e.g. boxscore links).
+    fetch: Callable
+        Function fetching a single item, fetch(item) -> result.
+    concurrency: Union[int, None] = None
+        An integer representing maximum number of fetches running at
+        once. If value is not specified, default value is None -> value
+        of SCRAPING_CONCURRENCY variable is used.
+
+    Yields
+    ------
+    tuple
+        A tuple (item, result) in the same order as items.
+    """
+    concurrency = concurrency or SCRAPING_CONCURRENCY
+    results = queue.Queue(maxsize=concurrency)
+    stop = threading.Event()
+
+    producer = threading.Thread(
+        target=asyncio.run,
+        args=(_produce(items, fetch, results, concurrency, stop),),
+        daemon=True,
+    )
+    producer.start()
+
+    entry = None
+    try:
+        while True:
+            entry = results.get()
+            if entry is _END:
+                break
+
+            item, result, error = entry
+            if error is not None:
+                raise error
+
+            yield item, result
+    finally:
+        # Stop fetching when caller stops iterating (or fails)
+        stop.set()
+        while entry is not _END:
+            entry = results.get()
+        producer.join()
@@ -1,18 +1,26 @@
-import time
+from contextlib import nullcontext
 from typing import Union
 
 import pandas as pd
-from sqlalchemy import select, func, desc
+from sqlalchemy import select, insert, update
+from sqlalchemy.orm import Session
 
 from src.logging_setup import logger
-from src.session_config import session, Sess
+from src.session_config import Sess
 
 from src.data_models.nhl_teams import team_abbreviations
-from src.data_models.game import Game
-from src.data_models.team import Team
 from src.data_models.player import Player, SkaterStat, SkaterStatAdvanced, GoalieStat
 
-from src.data_preprocessing.game_data import scraping_data, scraping_links
+from src.data_preprocessing.game_data import (
+    missing_games,
+    boxscore_link,
+    season_of,
+    game_index,
+)
+from src.data_preprocessing.team_registry import team_registry
+from src.data_preprocessing.boxscore import BoxscorePage, prefetch_boxscore_pages
+from src.data_preprocessing.html_tables import player_slug
+from src.data_preprocessing.roster_cache import roster_cache
 
 from src.database.decorators import timer
 
@@ -21,6 +29,9 @@ from src.database.decorators import timer
 def players():
     """Prepare data of players.
 
+    Rosters are scraped into roster cache, so PlayerResolver does not
+    scrape them again when adding new players within the same run.
+
     Returns
     -------
     pd.DataFrame
@@ -35,30 +46,13 @@ def players():
 
     # For each team scrape players data
     for idx, abbr in enumerate(team_abbr, start=1):
-        logger.info(f"Scraping {idx}/{len(team_abbr)} roster for {abbr}...")
-
-        # Default link for scraping team rosters
-        link = "https://www.hockey-reference.com/teams/"
-
-        # Scrape roster tab by specifying tab name
-        roster = pd.read_html(f"{link}{abbr}/", match="Roster")
-
-        # If there are multiple tables matching the name, select the desired one
-        # Assuming the desired table is the first one
-        roster = roster[0].iloc[:-1]
+        logger.info(f"Preparing {idx}/{len(team_abbr)} roster for {abbr}...")
 
-        # Useful column from scraped table
-        scraped_cols = ["Player", "Pos"]
+        # Roster is scraped only once per run (or reused from persisted cache)
+        filtered = roster_cache.roster(abbr)
 
-        # Filtered DataFrame
-        filtered = roster[scraped_cols]
-
-        # Rename scraped columns for db purposes
-        new_cols = ["name", "pos"]
-        filtered.columns = new_cols
-
-        # Create a new column and insert abbr of specific team
-        team_id = session.scalars(select(Team.tid).where(Team.abbr == abbr)).first()
+        # Create a new column and insert tid of specific team
+        team_id = team_registry.tid(abbr)
 
         # Make sure, that team_id is not None
         if team_id:
@@ -67,143 +61,295 @@ def players():
         # Append DataFrame into list
         rosters.append(filtered)
 
-        # Define sleep time to avoid error requests
-        time.sleep(5)
-
     # Merge DataFrames from roster list into one DataFrame
     merged_df = pd.concat(rosters)
 
-    # Remove " (C)" pattern using regex - this matches the pattern " (C)" with optional whitespace characters (\s*)
-    # before and after the parentheses and the "C" character
-    merged_df["name"] = merged_df["name"].str.replace(
-        r"\s*\(\s*C\s*\)\s*", "", regex=True
-    )
-
     return merged_df
 
 
-def new_player(tid: int, player_name: str) -> None:
-    """Add new player into db table.
+class PlayerResolver:
+    """In-memory map of player identities.
 
-    If there is any new player in team, scrape data about him
-    and import these data into player table.
+    Player table is loaded only once per run. Players are identified by
+    Hockey Reference player id (slug) and team, so each player is
+    resolved by a single dictionary lookup. Players missing in the map
+    (new players or players who changed team) are added into player
+    table by a single insert. The player gets a new pid whenever they
+    play for a new team, the latest pid of the team is used.
 
-    Parameters
-    ----------
-    tid: int
-        An integer representing unique team identifier.
-    player_name: str
-        A player, for who will be appended into db table.
+    Players stored before player ids were introduced are matched by
+    name and team once, their player id is stored then.
     """
-    # Default link for scraping team rosters
-    link = "https://www.hockey-reference.com/teams/"
 
-    player_name = player_name
-
-    team_abbr = session.scalars(select(Team.abbr).where(Team.tid == tid)).first()
-
-    # Scrape roster tab by specifying tab nam
-    roster = pd.read_html(f"{link}{team_abbr}/", match="Roster")
+    def __init__(self) -> None:
+        # Latest pid of each (slug, tid) and (name, tid) pair
+        self.slug_pids = None
+        self.name_pids = {}
+        # Players without player id yet ((name, tid): pid)
+        self.unidentified_pids = {}
+
+    def _load(self, session: Union[Session, None] = None) -> None:
+        if self.slug_pids is not None:
+            return
+
+        with self._session(session) as sess:
+            rows = sess.execute(
+                select(Player.pid, Player.name, Player.slug, Player.tid).order_by(
+                    Player.pid
+                )
+            ).all()
 
-    # If there are multiple tables matching the name, select the desired one
-    # Assuming the desired table is the first one
-    roster = roster[0].iloc[:-1]
+        # Rows are ordered by pid, so the latest pid is kept
+        self.slug_pids = {}
+        for pid, name, slug, tid in rows:
+            self._add(pid, name, slug, tid)
+
+    @staticmethod
+    def _session(session: Union[Session, None]):
+        # Caller's transaction is used if given, own transaction otherwise
+        return nullcontext(session) if session is not None else Sess.begin()
+
+    def clear(self) -> None:
+        """Remove all players, the map is loaded again when needed.
+
+        Call it when a transaction adding players is rolled back, so no
+        pid of a rolled back player is kept.
+        """
+        self.slug_pids = None
+        self.name_pids = {}
+        self.unidentified_pids = {}
+
+    def _add(self, pid: int, name: str, slug: Union[str, None], tid: int) -> None:
+        self.name_pids[(name, tid)] = pid
+        if slug:
+            self.slug_pids[(slug, tid)] = pid
+        else:
+            self.unidentified_pids[(name, tid)] = pid
+
+    def pid(self, name: str, slug: Union[str, None], tid: int) -> Union[int, None]:
+        """Latest pid of the player within the team.
+
+        Parameters
+        ----------
+        name: str
+            A string representing player name.
+        slug: Union[str, None]
+            A string representing player id (None if page has no link).
+        tid: int
+            An integer representing unique team identifier.
+
+        Returns
+        -------
+        Union[int, None]
+            An integer representing pid, None if player is not known.
+        """
+        self._load()
+        if slug:
+            return self.slug_pids.get((slug, tid))
+        return self.name_pids.get((name, tid))
+
+    def _roster_records(self, tid: int, season: int, players: list) -> list:
+        # Roster of the season is taken from roster cache, it is scraped
+        # again only if some of players are missing there (e.g. after a trade)
+        team_abbr = team_registry.abbr(tid)
+        roster = roster_cache.roster(team_abbr, season)
+
+        def positions(roster: pd.DataFrame) -> dict:
+            # Players are searched by player id, by name if page has no link
+            by_slug = dict(zip(roster["slug"], roster["pos"]))
+            by_name = dict(zip(roster["name"], roster["pos"]))
+            return {
+                (name, slug): by_slug.get(slug) if slug else by_name.get(name)
+                for name, slug in players
+            }
+
+        pos = positions(roster)
+        if None in pos.values():
+            pos = positions(roster_cache.roster(team_abbr, season, refresh=True))
+
+        missing = [name for (name, _), player_pos in pos.items() if player_pos is None]
+        if missing:
+            raise LookupError(
+                f"Players {sorted(missing)} are not in {team_abbr} roster ({season})."
+            )
+
+        return [
+            {"name": name, "pos": player_pos, "slug": slug, "tid": tid}
+            for (name, slug), player_pos in pos.items()
+        ]
+
+    def add_missing(
+        self,
+        df: pd.DataFrame,
+        season: Union[int, None] = None,
+        session: Union[Session, None] = None,
+    ) -> None:
+        """Add players missing in the map into player table.
+
+        Positions of new players are taken from team rosters of the
+        season the players played in.
+
+        Parameters
+        ----------
+        df: pd.DataFrame
+            Pandas DataFrame with name, slug and tid columns (e.g. parsed
+            player stats of a single game).
+        season: Union[int, None] = None
+            An integer representing season of all rows. If value is not
+            specified, default value is None -> season of each row is
+            given by date of its stored game (gid column).
+        session: Union[Session, None] = None
+            Session of the caller's transaction (e.g. transaction of the
+            game the players played in), players are written within it.
+            If value is not specified, default value is None -> players
+            are committed by own transaction.
+        """
+        self._load(session)
+
+        if season is None:
+            seasons = [season_of(game_index.game(int(gid))[1]) for gid in df["gid"]]
+        else:
+            seasons = season
+
+        identified = []
+        missing = {}
+        queued = set()
+        players = df[["name", "slug", "tid"]].assign(season=seasons).drop_duplicates()
+        for name, slug, tid, player_season in players.itertuples(index=False):
+            tid = int(tid)
+            slug = slug if isinstance(slug, str) else None
+            # Player of several seasons is added only once
+            if self.pid(name, slug, tid) is not None or (name, slug, tid) in queued:
+                continue
+            queued.add((name, slug, tid))
+
+            # Player stored without player id yet
+            pid = self.unidentified_pids.pop((name, tid), None) if slug else None
+            if pid is not None:
+                self.slug_pids[(slug, tid)] = pid
+                identified.append({"pid": pid, "slug": slug})
+                continue
+
+            missing.setdefault((tid, int(player_season)), []).append((name, slug))
+
+        if identified:
+            with self._session(session) as sess:
+                # Update rows by primary key (pid)
+                sess.execute(update(Player), identified)
+
+        if not missing:
+            return
+
+        data = []
+        for (tid, player_season), players in missing.items():
+            data.extend(self._roster_records(tid, player_season, players))
+
+        with self._session(session) as sess:
+            print(
+                f"Importing new players ({', '.join(row['name'] for row in data)}) into Player object..."
+            )
+            # Insert all new players at once and get their pids
+            rows = sess.execute(
+                insert(Player).returning(
+                    Player.pid, Player.name, Player.slug, Player.tid
+                ),
+                data,
+            ).all()
 
-    # Useful column from scraped table
-    scraped_cols = ["Player", "Pos"]
+            print(f"Imported records: {len(rows)}")
+
+        for pid, name, slug, tid in rows:
+            self._add(pid, name, slug, tid)
+
+    def resolve(
+        self,
+        df: pd.DataFrame,
+        season: Union[int, None] = None,
+        session: Union[Session, None] = None,
+        add_players: bool = True,
+    ) -> pd.DataFrame:
+        """Replace player names and ids by pid values.
+
+        Parameters
+        ----------
+        df: pd.DataFrame
+            Pandas DataFrame with parsed player stats (name, slug, tid
+            and gid columns).
+        season: Union[int, None] = None
+            An integer representing season of all rows. If value is not
+            specified, default value is None -> season of each row is
+            given by date of its stored game.
+        session: Union[Session, None] = None
+            Session of the caller's transaction new players are written
+            within. If value is not specified, default value is None ->
+            new players are committed by own transaction.
+        add_players: bool = True
+            If True, players missing in the map are added into player
+            table (their team rosters may be fetched). If False, nothing
+            is written or fetched, players are resolved against stored
+            players only and unknown players get None pid.
+
+        Returns
+        -------
+        pd.DataFrame
+            Pandas DataFrame, where name and slug columns are replaced
+            by pid column.
+        """
+        if add_players:
+            self.add_missing(df, season, session)
+        else:
+            self._load(session)
 
-    # Filtered DataFrame
-    filtered = roster[scraped_cols]
+        pids = []
+        for name, slug, tid in zip(df["name"], df["slug"], df["tid"]):
+            slug = slug if isinstance(slug, str) else None
+            pid = self.pid(name, slug, int(tid))
+            # Player stored without player id yet is matched by name only
+            if pid is None and slug and not add_players:
+                pid = self.unidentified_pids.get((name, int(tid)))
+            pids.append(pid)
 
-    # Rename scraped columns for db purposes
-    new_cols = ["name", "pos"]
-    filtered.columns = new_cols
+        # Replace name and slug columns by pid column at the same position
+        df = df.drop(columns=["name", "slug"])
+        df.insert(0, "pid", pids)
 
-    # Make sure, that team_id is not None
-    if tid:
-        filtered.insert(2, "tid", tid)
+        return df
 
-    # Filter row with new player only
-    new_player_stat = filtered.query("name == @player_name")
 
-    # Convert DataFrame to list of dictionaries
-    data = new_player_stat.to_dict(orient="records")
-    with Sess.begin() as sess:
-        print(f"Importing a new player ({player_name}) into Player object...")
-        # row is a dictionary containing key-value pairs where the keys correspond to column names
-        for row in data:
-            # Unpack dictionary with keys matching the attribute names of a class
-            # and create an instance of that class with the corresponding values
-            record = Player(**row)
-            sess.add(record)
-        # Number of imported records
-        imported_count = len(data)
+# Player resolver shared by all scrapers within the process
+player_resolver = PlayerResolver()
 
-        print(f"Imported records: {imported_count}")
 
+def parse_basic_skater_stats(
+    page: BoxscorePage, gid: int, atid: int, htid: int
+) -> pd.DataFrame:
+    """Parse basic skater stats of both teams from a single game.
 
-@timer
-def basic_skater_stats(num_games: Union[int, None] = None) -> pd.DataFrame:
-    """Scrape basic skater stats for each team within games played.
+    Parsing does not touch the database, player names and ids are kept
+    in name and slug columns (see game_basic_skater_stats() for stats with pid
+    values).
 
     Parameters
     ----------
-    num_games: Union[int, None] = None
-        An integer, that represents number of games for which will be
-        skater basic stats scraped. If values are not specified, default
-        value is None -> scrape all missing player basic stats.
+    page: BoxscorePage
+        Boxscore page of the game.
+    gid: int
+        An integer representing unique game identifier.
+    atid: int
+        An integer representing unique identifier of away team.
+    htid: int
+        An integer representing unique identifier of home team.
 
     Returns
     -------
     pd.DataFrame
-        Pandas DataFrame representing output dataset with basic
-        skater stats. Each row corresponds to skater's basic stats
-        for a single game.
+        Pandas DataFrame representing basic skater stats. Each row
+        corresponds to skater's basic stats for the game.
     """
-    # Subquery to calculate row numbers for Game table
-    game_subquery = select(
-        Game.gid, func.row_number().over(order_by=Game.gid).label("row_num")
-    ).subquery()
-
-    # Last gid number in SkaterStat object
-    # Last gid number corresponds with index of next gid value
-    skater_stat_gid = session.scalars(
-        select(SkaterStat.gid).order_by(SkaterStat.gid.desc()).limit(1)
-    ).first()
-
-    # Query to get the row number of the last gid in Game table
-    game_gid_last_number = session.scalars(
-        select(game_subquery.c.row_num).order_by(desc(game_subquery.c.gid)).limit(1)
-    ).first()
-
-    # Query to get the row number of the selected gid (last gid in SkaterStat object) in Game table
-    ss_gid_last_number = session.scalars(
-        select(game_subquery.c.row_num).where(game_subquery.c.gid == skater_stat_gid)
-    ).first()
-
-    # If num_games is specified and SkaterStat object is not empty, modify
-    # range of scraped team stats
-    if num_games and ss_gid_last_number:
-        game_gid_last_number = ss_gid_last_number + num_games
-
-    # If num_games is specified and SkaterStat object is empty, modify range
-    # of scraped team stats
-    elif num_games and not ss_gid_last_number:
-        game_gid_last_number = num_games
-
-    # If SkaterStat object is empty, set up value as 0 (first value from list)
-    elif not ss_gid_last_number:
-        game_gid_last_number = 0
-
-    # Get basic game info from database
-    game_data = scraping_data()[ss_gid_last_number:game_gid_last_number]
-
-    # Scrape game links for further scraping
-    game_links = scraping_links()[ss_gid_last_number:game_gid_last_number]
-
     # Columns of output DataFrame
     new_columns = [
-        "pid",
+        "name",
+        "slug",
         "tid",
         "gid",
         "g",
@@ -224,216 +370,55 @@ def basic_skater_stats(num_games: Union[int, None] = None) -> pd.DataFrame:
         "toi",
     ]
 
-    # Scraped team stats
     scraped_basic_stats = []
-
-    # Iterate over each game data and web link
-    for idx, (data, link) in enumerate(zip(game_data, game_links), start=1):
-        gid, atid, htid = data[0], data[2], data[3]
-        # Get the atid abbr for logging purposes
-        atid_abbr = session.scalars(select(Team.abbr).where(Team.tid == atid)).first()
-        # Get the htid abbr for logging purposes
-        htid_abbr = session.scalars(select(Team.abbr).where(Team.tid == htid)).first()
-        logger.info(
-            f"Scraping {idx}/{len(game_data)} basic skater stats from gid ({gid}) | {atid_abbr} x {htid_abbr}..."
+    for tid, home in ((atid, False), (htid, True)):
+        # Scrape skater stats without first column (rank)
+        # Total row is stored in table footer, so it is not included
+        # Replace empty values by 0
+        table = page.table("skaters", home)
+        skater_stats = [
+            [0 if value is None else value for value in row[1:]] for row in table.rows()
+        ]
+        slugs = [player_slug(link) for link in table.links]
+
+        # Add player ids, tid and gid values after player names
+        scraped_basic_stats.extend(
+            [row[0], slug, tid, gid] + row[1:] for row, slug in zip(skater_stats, slugs)
         )
 
-        # Scrape skater stats for each game using pandas
-        # 2 index -> atid | 4 index -> htid
-        # Scrape skater stats without total row (last row) and first 2 rows,
-        # that represent headline rows
-        # First level columns are removed as well
-        atid_skater_stats = pd.read_html(link)[2].iloc[:-1, 1:].droplevel(0, axis=1)
-        htid_skater_stats = pd.read_html(link)[4].iloc[:-1, 1:].droplevel(0, axis=1)
-
-        # Replace NaN values by 0
-        atid_skater_stats = atid_skater_stats.where(pd.notnull(atid_skater_stats), 0)
-        htid_skater_stats = htid_skater_stats.where(pd.notnull(htid_skater_stats), 0)
-
-        # Player names in list for replacing them by pid values
-        atid_skaters = atid_skater_stats["Player"].tolist()
-        htid_skaters = htid_skater_stats["Player"].tolist()
-
-        # Prepare pid values for away team
-        atid_pid = []
-        for skater in atid_skaters:
-            # Get a list with all skater's pids
-            # There will be more than 1 if player played for one or more teams and
-            # now plays for another one
-            skater_pid = session.scalars(
-                select(Player.pid).where(Player.name == skater)
-            ).all()
-
-            # Get a list with all skater's tids
-            # There will be more than 1 if player played for one or more teams and
-            # now plays for another one
-            skater_tid = session.scalars(
-                select(Player.tid).where(Player.name == skater)
-            ).all()
-
-            # If skater is not in player table yet, add him into player table
-            # and append his pid into list above
-            if not skater_pid:
-                new_player(atid, skater)
-                # Refresh skater_pid after adding the new player
-                skater_pid = session.scalars(
-                    select(Player.pid).where(Player.name == skater)
-                ).all()
-                atid_pid.append(skater_pid[-1])
-
-            # If skater changed team and his current tid is not equal to a new
-            # team's tid, add him into player table and append his new pid
-            # into list above
-            elif skater_pid and atid not in skater_tid:
-                new_player(atid, skater)
-                # Refresh skater_pid after adding the new player
-                skater_pid = session.scalars(
-                    select(Player.pid).where(Player.name == skater)
-                ).all()
-                atid_pid.append(skater_pid[-1])
-
-            # Else add appropriate pid into list above
-            else:
-                atid_pid.append(skater_pid[-1])
-
-        # Prepare pid values for home team
-        htid_pid = []
-        for skater in htid_skaters:
-            # Get a list with all skater's pids
-            # There will be more than 1 if player played for one or more teams and
-            # now plays for another one
-            skater_pid = session.scalars(
-                select(Player.pid).where(Player.name == skater)
-            ).all()
-
-            # Get a list with all skater's tids
-            # There will be more than 1 if player played for one or more teams and
-            # now plays for another one
-            skater_tid = session.scalars(
-                select(Player.tid).where(Player.name == skater)
-            ).all()
-
-            # If skater is not in player table yet, add him into player table
-            # and append his pid into list above
-            if not skater_pid:
-                new_player(htid, skater)
-                # Refresh skater_pid after adding the new player
-                skater_pid = session.scalars(
-                    select(Player.pid).where(Player.name == skater)
-                ).all()
-                htid_pid.append(skater_pid[-1])
-
-            # If skater changed team and his current tid is not equal to a new
-            # team's tid, add him into player table and append his new pid
-            # into list above
-            elif skater_pid and htid not in skater_tid:
-                new_player(htid, skater)
-                # Refresh skater_pid after adding the new player
-                skater_pid = session.scalars(
-                    select(Player.pid).where(Player.name == skater)
-                ).all()
-                htid_pid.append(skater_pid[-1])
-
-            # Else add appropriate pid into list above
-            else:
-                htid_pid.append(skater_pid[-1])
-
-        # Relace player names by pid values
-        atid_skater_stats["Player"] = atid_pid
-        htid_skater_stats["Player"] = htid_pid
-
-        # Add tid column with values
-        atid_skater_stats.insert(1, "tid", atid)
-        htid_skater_stats.insert(1, "tid", htid)
-
-        # Add gid column with values
-        atid_skater_stats.insert(2, "gid", gid)
-        htid_skater_stats.insert(2, "gid", gid)
-
-        # Rename columns
-        atid_skater_stats.columns = new_columns
-        htid_skater_stats.columns = new_columns
-
-        # Append team stats into list
-        scraped_basic_stats.append(atid_skater_stats)
-        scraped_basic_stats.append(htid_skater_stats)
-
-        # Set pandas options for printing whole DataFrame if necessary
-        pd.set_option("display.max_rows", None)
-
-        # Define sleep time to avoid error requests
-        time.sleep(5)
-
-    # Merge DataFrames into one DataFrame
-    merged_df = pd.concat(scraped_basic_stats)
+    return pd.DataFrame(scraped_basic_stats, columns=new_columns)
 
-    return merged_df
 
+def parse_advanced_skater_stats(
+    page: BoxscorePage, gid: int, atid: int, htid: int
+) -> pd.DataFrame:
+    """Parse advanced skater stats of both teams from a single game.
 
-@timer
-def advanced_skater_stats(num_games: Union[int, None] = None) -> pd.DataFrame:
-    """Scrape advanced skater stats for each team within games played.
+    Parsing does not touch the database, player names and ids are kept
+    in name and slug columns (see game_advanced_skater_stats() for stats with pid
+    values).
 
     Parameters
     ----------
-    num_games: Union[int, None] = None
-        An integer, that represents number of games for which will be
-        skater advanced stats scraped. If values is not specified, default
-        value is None -> scrape all missing player advanced stats.
+    page: BoxscorePage
+        Boxscore page of the game.
+    gid: int
+        An integer representing unique game identifier.
+    atid: int
+        An integer representing unique identifier of away team.
+    htid: int
+        An integer representing unique identifier of home team.
 
     Returns
     -------
     pd.DataFrame
-        Pandas DataFrame representing output dataset with advanced
-        skater stats. Each row corresponds to skater's advanced stats
-        for a single game.
+        Pandas DataFrame representing advanced skater stats. Each row
+        corresponds to skater's advanced stats for the game.
     """
-    # Subquery to calculate row numbers for Game table
-    game_subquery = select(
-        Game.gid, func.row_number().over(order_by=Game.gid).label("row_num")
-    ).subquery()
-
-    # Last gid number in SkaterStatAdvanced object
-    # Last gid number corresponds with index of next gid value
-    skater_stat_advanced_gid = session.scalars(
-        select(SkaterStatAdvanced.gid).order_by(SkaterStatAdvanced.gid.desc()).limit(1)
-    ).first()
-
-    # Query to get the row number of the last gid in Game table
-    game_gid_last_number = session.scalars(
-        select(game_subquery.c.row_num).order_by(desc(game_subquery.c.gid)).limit(1)
-    ).first()
-
-    # Query to get the row number of the selected gid (last gid in SkaterStatAdvanced object) in Game table
-    ssa_gid_last_number = session.scalars(
-        select(game_subquery.c.row_num).where(
-            game_subquery.c.gid == skater_stat_advanced_gid
-        )
-    ).first()
-
-    # If num_games is specified and SkaterStatAdvanced object is not empty, modify
-    # range of scraped team stats
-    if num_games and ssa_gid_last_number:
-        game_gid_last_number = ssa_gid_last_number + num_games
-
-    # If num_games is specified and SkaterStatAdvanced object is empty, modify range
-    # of scraped team stats
-    elif num_games and not ssa_gid_last_number:
-        game_gid_last_number = num_games
-
-    # If SkaterStatAdvanced object is empty, set up value as 0 (first value from list)
-    elif not ssa_gid_last_number:
-        game_gid_last_number = 0
-
-    # Get basic game info from database
-    game_data = scraping_data()[ssa_gid_last_number:game_gid_last_number]
-
-    # Scrape game links for further scraping
-    game_links = scraping_links()[ssa_gid_last_number:game_gid_last_number]
-
     # Columns of output DataFrame
     new_columns = [
-        "pid",
+        "name",
+        "slug",
         "tid",
         "gid",
         "icf",
@@ -448,203 +433,51 @@ def advanced_skater_stats(num_games: Union[int, None] = None) -> pd.DataFrame:
         "blk",
     ]
 
-    # Scraped team stats
     scraped_advanced_stats = []
-
-    # Iterate over each game data and web link
-    for idx, (data, link) in enumerate(zip(game_data, game_links), start=1):
-        gid, atid, htid = data[0], data[2], data[3]
-        atid_abbr = session.scalars(select(Team.abbr).where(Team.tid == atid)).first()
-        # Get the htid abbr for logging purposes
-        htid_abbr = session.scalars(select(Team.abbr).where(Team.tid == htid)).first()
-        logger.info(
-            f"Scraping {idx}/{len(game_data)} advanced skater stats for gid ({gid}) | {atid_abbr} x {htid_abbr}..."
+    for tid, home in ((atid, False), (htid, True)):
+        # Scrape skater advanced stats in all situations
+        # Total row is stored in table footer, so it is not included
+        table = page.table("adv_ALLAll", home)
+        slugs = [player_slug(link) for link in table.links]
+
+        # Add player ids, tid and gid values after player names
+        scraped_advanced_stats.extend(
+            [row[0], slug, tid, gid] + row[1:] for row, slug in zip(table.rows(), slugs)
         )
 
-        # Scrape skater advanced stats for each game using pandas
-        # All situations: 6 index -> atid | 13 index -> htid
-        # Scrape skater stats without total row (last row)
-        atid_skater_stats = pd.read_html(link)[6].iloc[:-1]
-        htid_skater_stats = pd.read_html(link)[13].iloc[:-1]
-
-        # Player names in list for replacing them by pid values
-        atid_skaters = atid_skater_stats["Player"].tolist()
-        htid_skaters = htid_skater_stats["Player"].tolist()
-
-        # Prepare pid values for away team
-        atid_pid = []
-        for skater in atid_skaters:
-            # Get a list with all skater's pids
-            # There will be more than 1 if player played for one or more teams and
-            # now plays for another one
-            skater_pid = session.scalars(
-                select(Player.pid).where(Player.name == skater)
-            ).all()
-
-            # Get a list with all skater's tids
-            # There will be more than 1 if player played for one or more teams and
-            # now plays for another one
-            skater_tid = session.scalars(
-                select(Player.tid).where(Player.name == skater)
-            ).all()
-
-            # If skater is not in player table yet, add him into player table
-            # and append his pid into list above
-            if not skater_pid:
-                new_player(atid, skater)
-                # Refresh skater_pid after adding the new player
-                skater_pid = session.scalars(
-                    select(Player.pid).where(Player.name == skater)
-                ).all()
-                atid_pid.append(skater_pid[-1])
-
-            # If skater changed team and his current tid is not equal to a new
-            # team's tid, add him into player table and append his new pid
-            # into list above
-            elif skater_pid and atid not in skater_tid:
-                new_player(atid, skater)
-                # Refresh skater_pid after adding the new player
-                skater_pid = session.scalars(
-                    select(Player.pid).where(Player.name == skater)
-                ).all()
-                atid_pid.append(skater_pid[-1])
-
-            # Else add appropriate pid into list above
-            else:
-                atid_pid.append(skater_pid[-1])
-
-        # Prepare pid values for home team
-        htid_pid = []
-        for skater in htid_skaters:
-            # Get a list with all skater's pids
-            # There will be more than 1 if player played for one or more teams and
-            # now plays for another one
-            skater_pid = session.scalars(
-                select(Player.pid).where(Player.name == skater)
-            ).all()
+    return pd.DataFrame(scraped_advanced_stats, columns=new_columns)
 
-            # Get a list with all skater's tids
-            # There will be more than 1 if player played for one or more teams and
-            # now plays for another one
-            skater_tid = session.scalars(
-                select(Player.tid).where(Player.name == skater)
-            ).all()
 
-            # If skater is not in player table yet, add him into player table
-            # and append his pid into list above
-            if not skater_pid:
-                new_player(htid, skater)
-                # Refresh skater_pid after adding the new player
-                skater_pid = session.scalars(
-                    select(Player.pid).where(Player.name == skater)
-                ).all()
-                htid_pid.append(skater_pid[-1])
-
-            # If skater changed team and his current tid is not equal to a new
-            # team's tid, add him into player table and append his new pid
-            # into list above
-            elif skater_pid and htid not in skater_tid:
-                new_player(htid, skater)
-                # Refresh skater_pid after adding the new player
-                skater_pid = session.scalars(
-                    select(Player.pid).where(Player.name == skater)
-                ).all()
-                htid_pid.append(skater_pid[-1])
-
-            # Else add appropriate pid into list above
-            else:
-                htid_pid.append(skater_pid[-1])
-
-        # Relace player names by pid values
-        atid_skater_stats["Player"] = atid_pid
-        htid_skater_stats["Player"] = htid_pid
-
-        # Add tid column with values
-        atid_skater_stats.insert(1, "tid", atid)
-        htid_skater_stats.insert(1, "tid", htid)
-
-        # Add gid column with values
-        atid_skater_stats.insert(2, "gid", gid)
-        htid_skater_stats.insert(2, "gid", gid)
-
-        # Rename columns
-        atid_skater_stats.columns = new_columns
-        htid_skater_stats.columns = new_columns
-
-        # Append team stats into list
-        scraped_advanced_stats.append(atid_skater_stats)
-        scraped_advanced_stats.append(htid_skater_stats)
-
-        # Define sleep time to avoid error requests
-        time.sleep(5)
+def parse_basic_goalie_stats(
+    page: BoxscorePage, gid: int, atid: int, htid: int
+) -> pd.DataFrame:
+    """Parse basic goalie stats of both teams from a single game.
 
-    # Merge DataFrames into one DataFrame
-    merged_df = pd.concat(scraped_advanced_stats)
-
-    return merged_df
-
-
-def basic_goalie_stats(num_games: Union[int, None] = None) -> pd.DataFrame:
-    """Scrape basic goalie stats for each team within games played.
+    Parsing does not touch the database, player names and ids are kept
+    in name and slug columns (see game_basic_goalie_stats() for stats with pid
+    values).
 
     Parameters
     ----------
-    num_games: Union[int, None] = None
-        An integer, that represents number of games for which will be
-        goalie stats scraped. If values is not specified, default value
-        is None -> scrape all missing goalie stats.
+    page: BoxscorePage
+        Boxscore page of the game.
+    gid: int
+        An integer representing unique game identifier.
+    atid: int
+        An integer representing unique identifier of away team.
+    htid: int
+        An integer representing unique identifier of home team.
 
     Returns
     -------
     pd.DataFrame
-        Pandas DataFrame representing output dataset with basic
-        goalie stats. Each row corresponds to goalie's basic stats
-        for a single game.
+        Pandas DataFrame representing basic goalie stats. Each row
+        corresponds to goalie's basic stats for the game.
     """
-    # Subquery to calculate row numbers for Game table
-    game_subquery = select(
-        Game.gid, func.row_number().over(order_by=Game.gid).label("row_num")
-    ).subquery()
-
-    # Last gid number in GoalieStat object
-    # Last gid number corresponds with index of next gid value
-    goalie_stat_gid = session.scalars(
-        select(GoalieStat.gid).order_by(GoalieStat.gid.desc()).limit(1)
-    ).first()
-
-    # Query to get the row number of the last gid in Game table
-    game_gid_last_number = session.scalars(
-        select(game_subquery.c.row_num).order_by(desc(game_subquery.c.gid)).limit(1)
-    ).first()
-
-    # Query to get the row number of the selected gid (last gid in GoalieStat object) in Game table
-    gs_gid_last_number = session.scalars(
-        select(game_subquery.c.row_num).where(game_subquery.c.gid == goalie_stat_gid)
-    ).first()
-
-    # If num_games is specified and GoalieStat object is not empty, modify
-    # range of scraped team stats
-    if num_games and gs_gid_last_number:
-        game_gid_last_number = gs_gid_last_number + num_games
-
-    # If num_games is specified and GoalieStat object is empty, modify range
-    # of scraped team stats
-    elif num_games and not gs_gid_last_number:
-        game_gid_last_number = num_games
-
-    # If GoalieStat object is empty, set up value as 0 (first value from list)
-    elif not gs_gid_last_number:
-        game_gid_last_number = 0
-
-    # Get basic game info from database
-    game_data = scraping_data()[gs_gid_last_number:game_gid_last_number]
-
-    # Scrape game links for further scraping
-    game_links = scraping_links()[gs_gid_last_number:game_gid_last_number]
-
     # Columns of output DataFrame
     new_columns = [
-        "pid",
+        "name",
+        "slug",
         "tid",
         "gid",
         "dec",
@@ -659,210 +492,290 @@ def basic_goalie_stats(num_games: Union[int, None] = None) -> pd.DataFrame:
         "enga",
     ]
 
-    # Scraped goalie stats
+    scraped_basic_stats = []
+    for tid, home in ((atid, False), (htid, True)):
+        # Scrape goalie stats without first column (rank), player id is
+        # taken from link of player page
+        # Slug | Player | DEC | GA | SA | SV | SV% | SO | PIM | TOI
+        table = page.table("goalies", home)
+        goalie_rows = [
+            [player_slug(link)] + row[1:] for row, link in zip(table.rows(), table.links)
+        ]
+        goalie_names = [row[1] for row in goalie_rows]
+
+        # Remove redundat rows (wrong data on web - e.g. goalie that did not play at the game)
+        # If team played with empty net and there is another goalie that played after that, remove him
+        if "Empty Net" in goalie_names and goalie_names[-1] != "Empty Net":
+            goalie_rows = goalie_rows[:-1]
+
+        goalie_stats = []
+        for slug, player, dec, ga, sa, sv, svp, so, pim, toi in goalie_rows:
+            if player == "Empty Net":
+                # Set 'EN' to True and copy 'GA' value to 'ENGA' in the row before
+                goalie_stats[-1][-2] = True
+                goalie_stats[-1][-1] = ga
+                continue
+
+            # Replace empty values by GC (goalie change) and 0 values within DEC and SV% columns
+            # Set up default values of EN and ENGA columns
+            goalie_stats.append(
+                [
+                    player,
+                    slug,
+                    "GC" if dec is None else dec,
+                    ga,
+                    sa,
+                    sv,
+                    0 if svp is None else svp,
+                    so,
+                    pim,
+                    toi,
+                    False,
+                    0,
+                ]
+            )
+
+        # Add tid and gid values after player names and ids
+        scraped_basic_stats.extend(row[:2] + [tid, gid] + row[2:] for row in goalie_stats)
+
+    return pd.DataFrame(scraped_basic_stats, columns=new_columns)
+
+
+def resolve_player_pids(df: pd.DataFrame, add_players: bool = True) -> pd.DataFrame:
+    """Replace player names and ids by pid values.
+
+    Parameters
+    ----------
+    df: pd.DataFrame
+        Pandas DataFrame with parsed player stats of stored games (name,
+        slug, tid and gid columns). Positions of new players are taken
+        from rosters of the season of each game.
+    add_players: bool = True
+        If True, new players are added into player table. If False,
+        only stored players are resolved (see PlayerResolver.resolve()).
+
+    Returns
+    -------
+    pd.DataFrame
+        Pandas DataFrame, where name and slug columns are replaced by
+        pid column.
+    """
+    return player_resolver.resolve(df, add_players=add_players)
+
+
+def game_basic_skater_stats(
+    page: BoxscorePage, gid: int, atid: int, htid: int
+) -> pd.DataFrame:
+    """Prepare basic skater stats of both teams from a single game.
+
+    Parameters
+    ----------
+    page: BoxscorePage
+        Boxscore page of the game.
+    gid: int
+        An integer representing unique game identifier.
+    atid: int
+        An integer representing unique identifier of away team.
+    htid: int
+        An integer representing unique identifier of home team.
+
+    Returns
+    -------
+    pd.DataFrame
+        Pandas DataFrame representing basic skater stats. Each row
+        corresponds to skater's stats for the game.
+    """
+    return resolve_player_pids(parse_basic_skater_stats(page, gid, atid, htid))
+
+
+def game_advanced_skater_stats(
+    page: BoxscorePage, gid: int, atid: int, htid: int
+) -> pd.DataFrame:
+    """Prepare advanced skater stats of both teams from a single game.
+
+    Parameters
+    ----------
+    page: BoxscorePage
+        Boxscore page of the game.
+    gid: int
+        An integer representing unique game identifier.
+    atid: int
+        An integer representing unique identifier of away team.
+    htid: int
+        An integer representing unique identifier of home team.
+
+    Returns
+    -------
+    pd.DataFrame
+        Pandas DataFrame representing advanced skater stats. Each row
+        corresponds to skater's stats for the game.
+    """
+    return resolve_player_pids(parse_advanced_skater_stats(page, gid, atid, htid))
+
+
+def game_basic_goalie_stats(
+    page: BoxscorePage, gid: int, atid: int, htid: int
+) -> pd.DataFrame:
+    """Prepare basic goalie stats of both teams from a single game.
+
+    Parameters
+    ----------
+    page: BoxscorePage
+        Boxscore page of the game.
+    gid: int
+        An integer representing unique game identifier.
+    atid: int
+        An integer representing unique identifier of away team.
+    htid: int
+        An integer representing unique identifier of home team.
+
+    Returns
+    -------
+    pd.DataFrame
+        Pandas DataFrame representing basic goalie stats. Each row
+        corresponds to goalie's stats for the game.
+    """
+    return resolve_player_pids(parse_basic_goalie_stats(page, gid, atid, htid))
+
+
+@timer
+def basic_skater_stats(num_games: Union[int, None] = None) -> pd.DataFrame:
+    """Scrape basic skater stats for each team within games played.
+
+    Parameters
+    ----------
+    num_games: Union[int, None] = None
+        An integer, that represents number of games for which will be
+        skater basic stats scraped. If values are not specified, default
+        value is None -> scrape all missing player basic stats.
+
+    Returns
+    -------
+    pd.DataFrame
+        Pandas DataFrame representing output dataset with basic
+        skater stats. Each row corresponds to skater's basic stats
+        for a single game.
+    """
+    # Games still missing rows in SkaterStat table
+    game_data = missing_games(SkaterStat, num_games)
+
+    # Game links for further scraping
+    game_links = [boxscore_link(data[1], data[4]) for data in game_data]
+
+    # Scraped stats
     scraped_basic_stats = []
 
-    # Iterate over each game data and web link
-    for idx, (data, link) in enumerate(zip(game_data, game_links), start=1):
+    # Iterate over each game data and boxscore page
+    # Following boxscore pages are fetched while current game is processed
+    for idx, (data, page) in enumerate(
+        zip(game_data, prefetch_boxscore_pages(game_links)), start=1
+    ):
         gid, atid, htid = data[0], data[2], data[3]
-        atid_abbr = session.scalars(select(Team.abbr).where(Team.tid == atid)).first()
-        # Get the htid abbr for logging purposes
-        htid_abbr = session.scalars(select(Team.abbr).where(Team.tid == htid)).first()
+        # Get the team abbrs for logging purposes
+        atid_abbr, htid_abbr = team_registry.abbr(atid), team_registry.abbr(htid)
         logger.info(
-            f"Scraping {idx}/{len(game_data)} basic goalie stats from gid ({gid}) | {atid_abbr} x {htid_abbr}..."
+            f"Scraping {idx}/{len(game_data)} basic skater stats from gid ({gid}) | {atid_abbr} x {htid_abbr}..."
         )
 
-        # Scrape skater stats for each game using pandas
-        # 3 index -> atid | 5 index -> htid
-        # Scrape goalie stats without total row (last row) and first 2 rows,
-        # that represent headline rows
-        # First level columns are removed as well
-        atid_goalie_stats = pd.read_html(link)[3].iloc[:, 1:].droplevel(0, axis=1)
-        htid_goalie_stats = pd.read_html(link)[5].iloc[:, 1:].droplevel(0, axis=1)
+        # Append stats of both teams into list
+        scraped_basic_stats.append(game_basic_skater_stats(page, gid, atid, htid))
 
-        # Insert EN column and set up default values
-        atid_goalie_stats.insert(9, "EN", False)
-        htid_goalie_stats.insert(9, "EN", False)
+    # Merge DataFrames into one DataFrame
+    merged_df = pd.concat(scraped_basic_stats) if scraped_basic_stats else pd.DataFrame()
 
-        # Insert ENGA column and set up default values
-        atid_goalie_stats.insert(10, "ENGA", 0)
-        htid_goalie_stats.insert(10, "ENGA", 0)
+    return merged_df
 
-        # Remove redundat rows (wrong data on web - e.g. goalie that did not play at the game)
-        # If team played with empty net and there is another goalie that played after that, remove him from DataFrame
-        if (
-            "Empty Net" in atid_goalie_stats["Player"].values
-            and atid_goalie_stats["Player"].iloc[-1] != "Empty Net"
-        ):
-            atid_goalie_stats.drop(atid_goalie_stats.tail(1).index, inplace=True)
-        else:
-            pass
 
-        # Remove redundat rows (wrong data on web - e.g. goalie that did not play at the game)
-        # If team played with empty net and there is another goalie that played after that, remove him from DataFrame
-        if (
-            "Empty Net" in htid_goalie_stats["Player"].values
-            and htid_goalie_stats["Player"].iloc[-1] != "Empty Net"
-        ):
-            htid_goalie_stats.drop(htid_goalie_stats.tail(1).index, inplace=True)
-        else:
-            pass
+@timer
+def advanced_skater_stats(num_games: Union[int, None] = None) -> pd.DataFrame:
+    """Scrape advanced skater stats for each team within games played.
 
-        for i, row in atid_goalie_stats.iterrows():
-            if row["Player"] == "Empty Net":
-                # Set 'EN' to True in the row before
-                atid_goalie_stats.at[i - 1, "EN"] = True
+    Parameters
+    ----------
+    num_games: Union[int, None] = None
+        An integer, that represents number of games for which will be
+        skater advanced stats scraped. If values is not specified, default
+        value is None -> scrape all missing player advanced stats.
 
-                # Copy 'GA' value to 'ENGA' column in the row before
-                atid_goalie_stats.at[i - 1, "ENGA"] = row["GA"]
+    Returns
+    -------
+    pd.DataFrame
+        Pandas DataFrame representing output dataset with advanced
+        skater stats. Each row corresponds to skater's advanced stats
+        for a single game.
+    """
+    # Games still missing rows in SkaterStatAdvanced table
+    game_data = missing_games(SkaterStatAdvanced, num_games)
 
-                # Remove the 'Empty Net' row
-                atid_goalie_stats.drop(i, inplace=True)
+    # Game links for further scraping
+    game_links = [boxscore_link(data[1], data[4]) for data in game_data]
 
-        for i, row in htid_goalie_stats.iterrows():
-            if row["Player"] == "Empty Net":
-                # Set 'EN' to True in the row before
-                htid_goalie_stats.at[i - 1, "EN"] = True
+    # Scraped stats
+    scraped_advanced_stats = []
 
-                # Copy 'GA' value to 'ENGA' column in the row before
-                htid_goalie_stats.at[i - 1, "ENGA"] = row["GA"]
+    # Iterate over each game data and boxscore page
+    # Following boxscore pages are fetched while current game is processed
+    for idx, (data, page) in enumerate(
+        zip(game_data, prefetch_boxscore_pages(game_links)), start=1
+    ):
+        gid, atid, htid = data[0], data[2], data[3]
+        # Get the team abbrs for logging purposes
+        atid_abbr, htid_abbr = team_registry.abbr(atid), team_registry.abbr(htid)
+        logger.info(
+            f"Scraping {idx}/{len(game_data)} advanced skater stats from gid ({gid}) | {atid_abbr} x {htid_abbr}..."
+        )
 
-                # Remove the 'Empty Net' row
-                htid_goalie_stats.drop(i, inplace=True)
+        # Append stats of both teams into list
+        scraped_advanced_stats.append(game_advanced_skater_stats(page, gid, atid, htid))
 
-        # Reset index after dropping rows
-        atid_goalie_stats.reset_index(drop=True, inplace=True)
-        htid_goalie_stats.reset_index(drop=True, inplace=True)
+    # Merge DataFrames into one DataFrame
+    merged_df = pd.concat(scraped_advanced_stats) if scraped_advanced_stats else pd.DataFrame()
 
-        # Replace NaN values by GC (goalie change) and 0 values within DEC and SV% columns
-        atid_goalie_stats["DEC"] = atid_goalie_stats["DEC"].where(
-            pd.notnull(atid_goalie_stats["DEC"]), "GC"
-        )
-        atid_goalie_stats["SV%"] = atid_goalie_stats["SV%"].where(
-            pd.notnull(atid_goalie_stats["SV%"]), 0
-        )
-        htid_goalie_stats["DEC"] = htid_goalie_stats["DEC"].where(
-            pd.notnull(htid_goalie_stats["DEC"]), "GC"
-        )
-        htid_goalie_stats["SV%"] = htid_goalie_stats["SV%"].where(
-            pd.notnull(htid_goalie_stats["SV%"]), 0
-        )
+    return merged_df
 
-        # Player names in list for replacing them by pid values
-        atid_goalies = atid_goalie_stats["Player"].tolist()
-        htid_goalies = htid_goalie_stats["Player"].tolist()
-
-        # Prepare pid values for away team
-        atid_pid = []
-        for goalie in atid_goalies:
-            # Get a list with all goalie's pids
-            # There will be more than 1 if player played for one or more teams and
-            # now plays for another one
-            goalie_pid = session.scalars(
-                select(Player.pid).where(Player.name == goalie)
-            ).all()
 
-            # Get a list with all goalie's tids
-            # There will be more than 1 if player played for one or more teams and
-            # now plays for another one
-            goalie_tid = session.scalars(
-                select(Player.tid).where(Player.name == goalie)
-            ).all()
+def basic_goalie_stats(num_games: Union[int, None] = None) -> pd.DataFrame:
+    """Scrape basic goalie stats for each team within games played.
 
-            # If goalie is not in player table yet, add him into player table
-            # and append his pid into list above
-            if not goalie_pid:
-                new_player(atid, goalie)
-                # Refresh skater_pid after adding the new player
-                goalie_pid = session.scalars(
-                    select(Player.pid).where(Player.name == goalie)
-                ).all()
-                atid_pid.append(goalie_pid[-1])
-
-            # If goalie changed team and his current tid is not equal to a new
-            # team's tid, add him into player table and append his new pid
-            # into list above
-            elif goalie_pid and atid not in goalie_tid:
-                new_player(atid, goalie)
-                # Refresh skater_pid after adding the new player
-                goalie_pid = session.scalars(
-                    select(Player.pid).where(Player.name == goalie)
-                ).all()
-                atid_pid.append(goalie_pid[-1])
-
-            # Else add appropriate pid into list above
-            else:
-                atid_pid.append(goalie_pid[-1])
-
-        # Prepare pid values for home team
-        htid_pid = []
-        for goalie in htid_goalies:
-            # Get a list with all goalie's pids
-            # There will be more than 1 if player played for one or more teams and
-            # now plays for another one
-            goalie_pid = session.scalars(
-                select(Player.pid).where(Player.name == goalie)
-            ).all()
+    Parameters
+    ----------
+    num_games: Union[int, None] = None
+        An integer, that represents number of games for which will be
+        goalie stats scraped. If values is not specified, default value
+        is None -> scrape all missing goalie stats.
 
-            # Get a list with all goalie's tids
-            # There will be more than 1 if player played for one or more teams and
-            # now plays for another one
-            goalie_tid = session.scalars(
-                select(Player.tid).where(Player.name == goalie)
-            ).all()
+    Returns
+    -------
+    pd.DataFrame
+        Pandas DataFrame representing output dataset with basic
+        goalie stats. Each row corresponds to goalie's basic stats
+        for a single game.
+    """
+    # Games still missing rows in GoalieStat table
+    game_data = missing_games(GoalieStat, num_games)
+
+    # Game links for further scraping
+    game_links = [boxscore_link(data[1], data[4]) for data in game_data]
+
+    # Scraped stats
+    scraped_basic_stats = []
+
+    # Iterate over each game data and boxscore page
+    # Following boxscore pages are fetched while current game is processed
+    for idx, (data, page) in enumerate(
+        zip(game_data, prefetch_boxscore_pages(game_links)), start=1
+    ):
+        gid, atid, htid = data[0], data[2], data[3]
+        # Get the team abbrs for logging purposes
+        atid_abbr, htid_abbr = team_registry.abbr(atid), team_registry.abbr(htid)
+        logger.info(
+            f"Scraping {idx}/{len(game_data)} basic goalie stats from gid ({gid}) | {atid_abbr} x {htid_abbr}..."
+        )
 
-            # If goalie is not in player table yet, add him into player table
-            # and append his pid into list above
-            if not goalie_pid:
-                new_player(htid, goalie)
-                # Refresh skater_pid after adding the new player
-                goalie_pid = session.scalars(
-                    select(Player.pid).where(Player.name == goalie)
-                ).all()
-                htid_pid.append(goalie_pid[-1])
-
-            # If goalie changed team and his current tid is not equal to a new
-            # team's tid, add him into player table and append his new pid
-            # into list above
-            elif goalie_pid and htid not in goalie_tid:
-                new_player(htid, goalie)
-                # Refresh skater_pid after adding the new player
-                goalie_pid = session.scalars(
-                    select(Player.pid).where(Player.name == goalie)
-                ).all()
-                htid_pid.append(goalie_pid[-1])
-
-            # Else add appropriate pid into list above
-            else:
-                htid_pid.append(goalie_pid[-1])
-
-        # Relace player names by pid values
-        atid_goalie_stats["Player"] = atid_pid
-        htid_goalie_stats["Player"] = htid_pid
-
-        # Add tid column with values
-        atid_goalie_stats.insert(1, "tid", atid)
-        htid_goalie_stats.insert(1, "tid", htid)
-
-        # Add gid column with values
-        atid_goalie_stats.insert(2, "gid", gid)
-        htid_goalie_stats.insert(2, "gid", gid)
-
-        # Rename columns
-        atid_goalie_stats.columns = new_columns
-        htid_goalie_stats.columns = new_columns
-
-        # Append team stats into list
-        scraped_basic_stats.append(atid_goalie_stats)
-        scraped_basic_stats.append(htid_goalie_stats)
-
-        # Set pandas options for printing whole DataFrame if necessary
-        pd.set_option("display.max_rows", None)
-
-        # Define sleep time to avoid error requests
-        time.sleep(5)
+        # Append stats of both teams into list
+        scraped_basic_stats.append(game_basic_goalie_stats(page, gid, atid, htid))
 
     # Merge DataFrames into one DataFrame
-    merged_df = pd.concat(scraped_basic_stats)
+    merged_df = pd.concat(scraped_basic_stats) if scraped_basic_stats else pd.DataFrame()
 
     return merged_df
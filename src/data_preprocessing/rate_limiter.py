@@ -0,0 +1,126 @@
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Union
+
+from config import SCRAPING_RATE, SCRAPING_BURST
+
+
+class RequestScheduler:
+    """Process-wide token bucket scheduler of network requests.
+
+    Bucket holds up to `capacity` tokens and is refilled with `rate`
+    tokens per second. Each request takes one token, so requests are
+    sent without waiting while tokens are available (e.g. no request
+    was made recently). When server responds with 429, requests are
+    paused for Retry-After seconds and rate is halved. Each successful
+    request then raises rate back towards the configured value.
+
+    Parameters
+    ----------
+    rate: float
+        A float representing number of requests per second.
+    capacity: int
+        An integer representing maximum number of requests sent at once.
+    """
+
+    def __init__(self, rate: float, capacity: int) -> None:
+        self.max_rate = rate
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+        # Requests are not allowed before this time (Retry-After)
+        self.blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def acquire(self) -> float:
+        """Wait until a request can be sent.
+
+        Returns
+        -------
+        float
+            A float representing waiting time in seconds.
+        """
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                if now < self.blocked_until:
+                    wait = self.blocked_until - now
+                else:
+                    self._refill(now)
+                    if self.tokens >= 1:
+                        self.tokens -= 1
+                        return waited
+                    wait = (1 - self.tokens) / self.rate
+
+            time.sleep(wait)
+            waited += wait
+
+    def backoff(self, retry_after: Union[float, None] = None) -> None:
+        """Slow down requests after server responded with 429.
+
+        Parameters
+        ----------
+        retry_after: Union[float, None] = None
+            A float representing number of seconds from Retry-After
+            header. If value is not specified, default value is None
+            -> requests are paused for one refill period.
+        """
+        with self._lock:
+            now = time.monotonic()
+            # Halve the rate, but keep at least one request per minute
+            self.rate = max(self.rate / 2, 1 / 60)
+            pause = retry_after if retry_after is not None else 1 / self.rate
+            self.blocked_until = max(self.blocked_until, now + pause)
+            # Tokens collected before 429 are not valid anymore
+            self.tokens = 0.0
+            self.updated = now + pause
+
+    def success(self) -> None:
+        """Raise rate back towards configured value after successful request."""
+        with self._lock:
+            self.rate = min(self.max_rate, self.rate * 1.1)
+
+
+def parse_retry_after(value: Union[str, None]) -> Union[float, None]:
+    """Parse Retry-After header.
+
+    Parameters
+    ----------
+    value: Union[str, None]
+        A string representing Retry-After header value. It is either
+        number of seconds or HTTP date.
+
+    Returns
+    -------
+    Union[float, None]
+        A float representing number of seconds to wait or None, if
+        header is missing or invalid.
+    """
+    if not value:
+        return None
+
+    if value.strip().isdigit():
+        return float(value)
+
+    try:
+        retry_date = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+
+    # HTTP dates are always in GMT
+    if retry_date.tzinfo is None:
+        retry_date = retry_date.replace(tzinfo=timezone.utc)
+
+    return max(0.0, (retry_date - datetime.now(timezone.utc)).total_seconds())
+
+
+# Scheduler shared by all scrapers within the process
+scheduler = RequestScheduler(rate=SCRAPING_RATE / 60, capacity=SCRAPING_BURST)
@@ -0,0 +1,152 @@
+from concurrent.futures import ProcessPoolExecutor
+from typing import Union
+
+import pandas as pd
+
+from src.logging_setup import logger
+
+from src.data_models.team import TeamStat, TeamStatAdvanced
+from src.data_models.player import SkaterStat, SkaterStatAdvanced, GoalieStat
+
+from src.data_preprocessing.fetch import archive
+from src.data_preprocessing.boxscore import BoxscorePage
+from src.data_preprocessing.game_data import scraping_data, scraping_links
+from src.data_preprocessing.team_data import (
+    game_basic_team_stats,
+    game_advanced_team_stats,
+)
+from src.data_preprocessing.player_data import (
+    parse_basic_skater_stats,
+    parse_advanced_skater_stats,
+    parse_basic_goalie_stats,
+    resolve_player_pids,
+)
+
+from src.database.decorators import timer
+
+
+def parse_archived_game(game: tuple) -> Union[dict, None]:
+    """Parse archived boxscore page of a single game.
+
+    Function runs within worker process, so it reads the archive only
+    and never touches the network or the database.
+
+    Parameters
+    ----------
+    game: tuple
+        A tuple (gid, atid, htid, link) representing a single game.
+
+    Returns
+    -------
+    Union[dict, None]
+        A dictionary where keys are class objects of stat tables and
+        values are pandas DataFrames with parsed stats (player names
+        are not replaced by pid values yet). None, if boxscore page
+        of the game is not archived.
+    """
+    gid, atid, htid, link = game
+
+    html = archive.latest(link)
+    if html is None:
+        return None
+
+    page = BoxscorePage(link, html)
+
+    return {
+        TeamStat: game_basic_team_stats(page, gid, atid, htid),
+        TeamStatAdvanced: game_advanced_team_stats(page, gid, atid, htid),
+        SkaterStat: parse_basic_skater_stats(page, gid, atid, htid),
+        SkaterStatAdvanced: parse_advanced_skater_stats(page, gid, atid, htid),
+        GoalieStat: parse_basic_goalie_stats(page, gid, atid, htid),
+    }
+
+
+@timer
+def reparse_games(
+    max_workers: Union[int, None] = None, add_players: bool = False
+) -> tuple:
+    """Re-parse archived boxscore pages of all games.
+
+    Archived pages are parsed in parallel by a pool of processes (one
+    per CPU core by default). Parsed stats are merged into the same
+    DataFrames as basic_team_stats(), basic_skater_stats() etc. return,
+    player names are replaced by pid values within main process.
+
+    By default nothing is written into the database and no roster is
+    fetched, players are resolved against stored players only. Rows of
+    players who cannot be resolved are left out and returned separately.
+
+    Parameters
+    ----------
+    max_workers: Union[int, None] = None
+        An integer representing number of worker processes. If value is
+        not specified, default value is None -> number of CPU cores.
+    add_players: bool = False
+        If True, players missing in player table are added into it
+        (rosters of their teams may be fetched), so all rows are
+        resolved.
+
+    Returns
+    -------
+    tuple
+        A tuple (stats, unresolved), where stats is a dictionary with
+        class objects of stat tables as keys and pandas DataFrames with
+        stats of all games as values, unresolved is a pandas DataFrame
+        with name, slug, tid and gid columns of unresolved players.
+    """
+    # Indexes: 0-gid, 1-date, 2-atid, 3-htid, 4-htid abbr
+    games = [
+        (data[0], data[2], data[3], link)
+        for data, link in zip(scraping_data(), scraping_links())
+    ]
+
+    parsed_stats = {}
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        # Games are sent to workers in chunks to limit inter-process overhead
+        results = executor.map(parse_archived_game, games, chunksize=16)
+
+        for idx, (game, game_stats) in enumerate(zip(games, results), start=1):
+            if game_stats is None:
+                logger.warning(f"Boxscore page of game ({game[0]}) is not archived.")
+                continue
+
+            for class_obj, df in game_stats.items():
+                parsed_stats.setdefault(class_obj, []).append(df)
+
+            if idx % 100 == 0:
+                logger.info(f"Re-parsed {idx}/{len(games)} games...")
+
+    output = {
+        class_obj: pd.concat(dfs, ignore_index=True)
+        for class_obj, dfs in parsed_stats.items()
+    }
+
+    # Player names are resolved within main process (database access)
+    unresolved = []
+    for class_obj in (SkaterStat, SkaterStatAdvanced, GoalieStat):
+        if class_obj in output:
+            df = output[class_obj]
+            df_resolved = resolve_player_pids(df, add_players)
+
+            known = df_resolved["pid"].notna()
+            unresolved.append(df.loc[~known, ["name", "slug", "tid", "gid"]])
+            output[class_obj] = df_resolved[known].astype({"pid": int})
+
+    df_unresolved = (
+        pd.concat(unresolved, ignore_index=True).drop_duplicates()
+        if unresolved
+        else pd.DataFrame(columns=["name", "slug", "tid", "gid"])
+    )
+    if len(df_unresolved):
+        logger.warning(
+            f"{df_unresolved['name'].nunique()} players are not in Player table, their rows are left out."
+        )
+
+    return output, df_unresolved
+
+
+if __name__ == "__main__":
+    stats, unresolved = reparse_games()
+    for class_obj, df in stats.items():
+        print(f"{class_obj.__name__}: {len(df)} rows")
+    print(f"Unresolved players: {len(unresolved)}")
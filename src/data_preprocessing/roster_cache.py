@@ -0,0 +1,154 @@
+import json
+import threading
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Union
+
+import pandas as pd
+
+from config import NHL_SEASON, ROSTER_CACHE_PATH, ROSTER_CACHE_MAX_AGE
+from src.logging_setup import logger
+from src.data_preprocessing.fetch import fetch_html
+from src.data_preprocessing.html_tables import extract_tables, player_slug
+
+
+def scrape_roster(abbr: str, season: int = NHL_SEASON) -> pd.DataFrame:
+    """Scrape roster of a single team within a single season.
+
+    Parameters
+    ----------
+    abbr: str
+        A string representing team abbreviation.
+    season: int = NHL_SEASON
+        An integer representing season by the year of its end. If value
+        is not specified, current season is used.
+
+    Returns
+    -------
+    pd.DataFrame
+        Pandas DataFrame with name, pos and slug (player id) columns.
+    """
+    # Default link for scraping team rosters
+    link = "https://www.hockey-reference.com/teams/"
+
+    # Parse roster table only (selected by its HTML id) from season page,
+    # so players of past seasons are found as well
+    tables = extract_tables(fetch_html(f"{link}{abbr}/{season}.html"), "roster")
+    if not tables:
+        raise LookupError(f"Roster table not found for {abbr} ({season}).")
+    roster = tables[0]
+
+    # Useful columns from scraped table, player id is taken from link
+    # of player page
+    filtered = pd.DataFrame(
+        {
+            "name": roster.column("Player"),
+            "pos": roster.column("Pos"),
+            "slug": [player_slug(link) for link in roster.links],
+        }
+    )
+
+    # Remove " (C)" pattern using regex - this matches the pattern " (C)" with optional whitespace characters (\s*)
+    # before and after the parentheses and the "C" character
+    filtered["name"] = filtered["name"].str.replace(
+        r"\s*\(\s*C\s*\)\s*", "", regex=True
+    )
+
+    return filtered
+
+
+class RosterCache:
+    """Cache of team rosters by season.
+
+    Each roster (team and season) is scraped at most once per run. Optionally, rosters
+    are persisted into JSON file and reused by following runs while
+    they are not older than `max_age`.
+
+    Parameters
+    ----------
+    path: Union[str, Path, None] = None
+        Path of JSON file with persisted rosters. If value is not
+        specified, default value is None -> rosters are not persisted.
+    max_age: timedelta = timedelta(hours=24)
+        Maximum age of persisted roster to be reused.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path, None] = None,
+        max_age: timedelta = timedelta(hours=24),
+    ) -> None:
+        self.path = Path(path) if path else None
+        self.max_age = max_age
+        # Rosters ("abbr/season": (fetched, DataFrame)) and keys scraped within this run
+        self.rosters = {}
+        self.scraped = set()
+        self._lock = threading.Lock()
+        self._load()
+
+    def _load(self) -> None:
+        if self.path is None or not self.path.exists():
+            return
+
+        with open(self.path, encoding="utf-8") as cache_file:
+            for key, cached in json.load(cache_file).items():
+                fetched = datetime.fromisoformat(cached["fetched"])
+                # Rosters persisted without season or player ids are scraped again
+                has_slugs = all("slug" in player for player in cached["players"])
+                if "/" in key and has_slugs and datetime.now() - fetched <= self.max_age:
+                    self.rosters[key] = (fetched, pd.DataFrame(cached["players"]))
+
+    def _save(self) -> None:
+        if self.path is None:
+            return
+
+        data = {
+            key: {
+                "fetched": fetched.isoformat(timespec="seconds"),
+                "players": roster.to_dict(orient="records"),
+            }
+            for key, (fetched, roster) in self.rosters.items()
+        }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "w", encoding="utf-8") as cache_file:
+            json.dump(data, cache_file)
+
+    def roster(
+        self, abbr: str, season: int = NHL_SEASON, refresh: bool = False
+    ) -> pd.DataFrame:
+        """Roster of a single team within a single season.
+
+        Parameters
+        ----------
+        abbr: str
+            A string representing team abbreviation.
+        season: int = NHL_SEASON
+            An integer representing season by the year of its end. If
+            value is not specified, current season is used.
+        refresh: bool = False
+            If True, roster is scraped again unless it was already
+            scraped within this run (e.g. persisted roster is outdated
+            after a trade).
+
+        Returns
+        -------
+        pd.DataFrame
+            Pandas DataFrame with name, pos and slug columns.
+        """
+        key = f"{abbr}/{season}"
+        with self._lock:
+            cached = self.rosters.get(key)
+            if cached is not None and (not refresh or key in self.scraped):
+                return cached[1].copy()
+
+            logger.info(f"Scraping roster for {abbr} ({season})...")
+            roster = scrape_roster(abbr, season)
+            self.rosters[key] = (datetime.now(), roster)
+            self.scraped.add(key)
+            self._save()
+
+            return roster.copy()
+
+
+# Roster cache shared by all scrapers within the process
+roster_cache = RosterCache(ROSTER_CACHE_PATH, timedelta(hours=ROSTER_CACHE_MAX_AGE))
@@ -0,0 +1,60 @@
+from typing import Union
+
+from sqlalchemy import select
+
+from src.session_config import Sess
+from src.data_models.nhl_teams import teams_dict
+from src.data_models.team import Team
+
+
+class TeamRegistry:
+    """Per-run lookup of NHL teams.
+
+    Team table is loaded only once per run (there are only 32 teams),
+    so scrapers map tid, abbreviation and team name without database
+    round-trips. Team names used by the website are mapped to
+    abbreviations by nhl_teams.teams_dict.
+    """
+
+    def __init__(self) -> None:
+        # abbr: tid | tid: abbr
+        self.tids = {}
+        self.abbrs = {}
+
+    def _load(self) -> None:
+        # Empty team table (not populated yet) is loaded again next time
+        if self.tids:
+            return
+
+        with Sess.begin() as session:
+            for tid, abbr in session.execute(select(Team.tid, Team.abbr)).all():
+                self.tids[abbr] = tid
+                self.abbrs[tid] = abbr
+
+    def tid(self, abbr: str) -> Union[int, None]:
+        """Team identifier of the abbreviation, None if team is unknown."""
+        self._load()
+        return self.tids.get(abbr)
+
+    def abbr(self, tid: int) -> str:
+        """Abbreviation of the team."""
+        self._load()
+        return self.abbrs[tid]
+
+    def name_tid(self, name: str) -> Union[int, None]:
+        """Team identifier of the team name, None if team is unknown."""
+        return self.tid(teams_dict.get(name, name))
+
+    def tid_mapping(self) -> dict:
+        """A dictionary mapping team abbreviations to tid values."""
+        self._load()
+        return dict(self.tids)
+
+    def clear(self) -> None:
+        """Remove all teams, the registry is loaded again when needed."""
+        self.tids.clear()
+        self.abbrs.clear()
+
+
+# Team registry shared by all scrapers within the process
+team_registry = TeamRegistry()
@@ -0,0 +1,55 @@
+import sys
+
+from config import NHL_SEASON, SCRAPING_RATE
+from src.logging_setup import logger
+from src.database.decorators import timer
+from src.database.db_manager import ingest_games
+
+from src.data_preprocessing.game_data import plan_season
+from src.data_preprocessing.http_client import client
+
+
+@timer
+def backfill(first_season: int, last_season: int = NHL_SEASON) -> None:
+    """Ingest all games of selected seasons.
+
+    Seasons are ingested in chronological order, each game is committed
+    together with its stats and checkpoint. If the run is interrupted,
+    next run with the same seasons resumes after the last committed
+    game, so no page is fetched twice.
+
+    Backfilled games get greater gid values than already stored games of
+    later seasons, so gid does not follow game dates. Last-N queries
+    order games by date (gid only breaks ties within a date).
+
+    Parameters
+    ----------
+    first_season: int
+        An integer representing the first season by the year of its end
+        (2022 -> 2021-22 season).
+    last_season: int = NHL_SEASON
+        An integer representing the last season by the year of its end.
+        If value is not specified, current season is used.
+
+    Returns
+    -------
+    None
+
+    """
+    for season in range(first_season, last_season + 1):
+        df_plan = plan_season(season)
+
+        # Rough duration estimate given by rate limit of boxscore pages
+        logger.info(
+            f"Season {season}: {len(df_plan)} games to ingest (~{len(df_plan) / SCRAPING_RATE:.0f} minutes)..."
+        )
+
+        if len(df_plan):
+            ingest_games(df_plan, season)
+
+    logger.info(f"HTTP requests: {client.stats()}")
+
+
+if __name__ == "__main__":
+    # Usage: python -m src.database.backfill FIRST_SEASON [LAST_SEASON]
+    backfill(*(int(arg) for arg in sys.argv[1:]))
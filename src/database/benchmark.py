@@ -0,0 +1,635 @@
+import json
+import sys
+from datetime import datetime
+from pathlib import Path
+from typing import Union
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from config import BENCHMARK_DIR
+from src.logging_setup import logger
+from src.session_config import Sess
+from src.data_models.game import Game
+from src.data_models.team import Team, TeamGame, TeamStat
+from src.data_models.player import Player, SkaterStat
+from src.database.db_manager import copy_rows
+from src.database.queries import (
+    PSQL_DIR,
+    sql_files,
+    read_sql_file,
+    bind_params,
+)
+
+
+# Default bind parameters of SQL queries
+DEFAULT_PARAMS = {"last_n": 10, "team_id": 1}
+
+# Stats with most common value (mode) within player overview queries
+MODE_STATS = ["sog", "pts", "g", "ppg", "a", "ppa", "pm"]
+
+# Plan nodes worth comparing (full scans and sorts vs. index range scans)
+SCAN_NODES = {"Seq Scan", "Index Scan", "Index Only Scan", "Bitmap Heap Scan", "Sort"}
+
+
+def plan_nodes(plan: dict) -> list:
+    """Scan and sort nodes of query plan as "Node Type (relation)" strings."""
+    nodes = []
+    if plan["Node Type"] in SCAN_NODES:
+        relation = plan.get("Index Name") or plan.get("Relation Name") or ""
+        nodes.append(f"{plan['Node Type']} ({relation})" if relation else plan["Node Type"])
+    for child in plan.get("Plans", []):
+        nodes.extend(plan_nodes(child))
+    return nodes
+
+
+def explain_sql(session: Session, sql: str, params: dict) -> dict:
+    """Run EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) of SQL query.
+
+    Parameters
+    ----------
+    session: Session
+        Session the query is executed by.
+    sql: str
+        A string representing SQL query.
+    params: dict
+        Bind parameters of the query (unused ones are ignored).
+
+    Returns
+    -------
+    dict
+        A dictionary with planning and execution time in milliseconds,
+        scan/sort nodes and the whole query plan.
+    """
+    stmt = text(f"EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) {sql}")
+    explained = session.execute(stmt, bind_params(sql, params)).scalar_one()
+
+    # psycopg2 decodes json column, other drivers may return raw text
+    if isinstance(explained, str):
+        explained = json.loads(explained)
+    result = explained[0]
+
+    return {
+        "planning_ms": result["Planning Time"],
+        "execution_ms": result["Execution Time"],
+        "nodes": plan_nodes(result["Plan"]),
+        "plan": result["Plan"],
+    }
+
+
+def explain_sql_file(path: Path, params: dict = DEFAULT_PARAMS) -> dict:
+    """Run EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) of a single SQL query.
+
+    Parameters
+    ----------
+    path: Path
+        Path of SQL query.
+    params: dict = DEFAULT_PARAMS
+        Bind parameters of the query (unused ones are ignored).
+
+    Returns
+    -------
+    dict
+        A dictionary with planning and execution time in milliseconds,
+        scan/sort nodes and the whole query plan.
+    """
+    # EXPLAIN ANALYZE executes the query, session is closed without commit
+    with Sess() as session:
+        return explain_sql(session, read_sql_file(path), params)
+
+
+def run_benchmark(label: str, params: dict = DEFAULT_PARAMS) -> Path:
+    """Record query plans and timings of all SQL queries into JSON file.
+
+    Run it before and after a change (e.g. new indexes) with different
+    labels and compare both files by compare_benchmarks(). A failing
+    query is logged and recorded with its error, remaining queries are
+    still benchmarked.
+
+    Parameters
+    ----------
+    label: str
+        A string representing name of the run (e.g. "before").
+    params: dict = DEFAULT_PARAMS
+        Bind parameters of the queries.
+
+    Returns
+    -------
+    Path
+        Path of JSON file with results (BENCHMARK_DIR/<label>.json).
+    """
+    results = {}
+    for path in sql_files():
+        name = str(path.relative_to(PSQL_DIR))
+        try:
+            results[name] = explain_sql_file(path, params)
+        except Exception as exc:
+            logger.error(f"{name}: {exc}")
+            results[name] = {"error": str(exc)}
+            continue
+        logger.info(
+            f"{name}: {results[name]['execution_ms']:.2f} ms | {', '.join(results[name]['nodes'])}"
+        )
+
+    output = Path(BENCHMARK_DIR) / f"{label}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with open(output, "w", encoding="utf-8") as output_file:
+        json.dump(
+            {
+                "label": label,
+                "created": datetime.now().isoformat(timespec="seconds"),
+                "params": params,
+                "queries": results,
+            },
+            output_file,
+            indent=2,
+        )
+
+    return output
+
+
+def compare_benchmarks(before: str, after: str) -> None:
+    """Print execution times and scan/sort nodes of two benchmark runs.
+
+    Parameters
+    ----------
+    before: str
+        A string representing label of the first run.
+    after: str
+        A string representing label of the second run.
+
+    Returns
+    -------
+    None
+
+    """
+    runs = []
+    for label in (before, after):
+        with open(Path(BENCHMARK_DIR) / f"{label}.json", encoding="utf-8") as run_file:
+            runs.append(json.load(run_file)["queries"])
+
+    for name in sorted(runs[0].keys() & runs[1].keys()):
+        first, second = runs[0][name], runs[1][name]
+        if "error" in first or "error" in second:
+            print(f"{name}: failed")
+            for label, run in ((before, first), (after, second)):
+                if "error" in run:
+                    print(f"  {label}: {run['error']}")
+            continue
+        speedup = first["execution_ms"] / max(second["execution_ms"], 0.001)
+        print(
+            f"{name}: {first['execution_ms']:.2f} ms -> {second['execution_ms']:.2f} ms ({speedup:.1f}x)"
+        )
+        print(f"  {before}: {', '.join(first['nodes'])}")
+        print(f"  {after}: {', '.join(second['nodes'])}")
+
+
+def same_results(result: pd.DataFrame, reference: pd.DataFrame, key: str) -> bool:
+    """Compare query result with reference computation.
+
+    Rows are matched by key column, only columns of reference are
+    compared. Numeric columns are compared with tolerance of rounding
+    to 2 decimals (missing values are equal).
+
+    Parameters
+    ----------
+    result: pd.DataFrame
+        Pandas DataFrame with rows returned by SQL query.
+    reference: pd.DataFrame
+        Pandas DataFrame with rows of reference computation.
+    key: str
+        A string representing name of key column (e.g. "tid").
+
+    Returns
+    -------
+    bool
+        True if both DataFrames contain the same rows.
+    """
+    reference = reference.set_index(key).sort_index()
+    result = result.set_index(key).sort_index()[reference.columns]
+
+    if not result.index.equals(reference.index):
+        logger.warning(f"Different {key} values: {set(result.index) ^ set(reference.index)}")
+        return False
+
+    same = True
+    for column in result.columns:
+        if not pd.api.types.is_numeric_dtype(reference[column]):
+            continue
+        matches = np.isclose(
+            result[column].astype(float),
+            reference[column].astype(float),
+            atol=0.006,
+            equal_nan=True,
+        )
+        if not matches.all():
+            logger.warning(f"{column} differs for {key}: {list(result.index[~matches])}")
+            same = False
+
+    return same
+
+
+def reference_team_last_win(
+    df_games: pd.DataFrame, df_team_stats: pd.DataFrame, last_n: int
+) -> pd.DataFrame:
+    """Reference computation of team_last_win.sql.
+
+    Average shots on goal of last N home and last N away games of each
+    team, computed from game and team_stat rows (team_game table is not
+    used).
+
+    Parameters
+    ----------
+    df_games: pd.DataFrame
+        Pandas DataFrame with gid, date, atid and htid columns.
+    df_team_stats: pd.DataFrame
+        Pandas DataFrame with gid, tid and sog columns.
+    last_n: int
+        An integer representing number of last games.
+
+    Returns
+    -------
+    pd.DataFrame
+        Pandas DataFrame with tid, avg_last_n_home_games and
+        avg_last_n_away_games columns.
+    """
+    sides = pd.concat(
+        [
+            df_games[["gid", "date", "htid"]].rename(columns={"htid": "tid"}).assign(is_home=True),
+            df_games[["gid", "date", "atid"]].rename(columns={"atid": "tid"}).assign(is_home=False),
+        ]
+    )
+    # Last N home and last N away games of each team
+    last_games = (
+        sides.sort_values(["date", "gid"], ascending=False)
+        .groupby(["tid", "is_home"])
+        .head(last_n)
+    )
+    last_stats = last_games.merge(df_team_stats[["gid", "tid", "sog"]], on=["gid", "tid"])
+
+    averages = last_stats.groupby(["tid", "is_home"])["sog"].mean().unstack()
+    return pd.DataFrame(
+        {
+            "tid": averages.index,
+            "avg_last_n_home_games": averages.get(True),
+            "avg_last_n_away_games": averages.get(False),
+        }
+    ).reset_index(drop=True).round(2)
+
+
+def copy_fixture(session: Session, fixture: dict) -> None:
+    """Copy generated rows into temporary tables of the session.
+
+    Temporary tables shadow the real tables of the same name within the
+    session (temporary schema is searched first), they are dropped when
+    the session is closed without commit, stored data are not touched.
+
+    Parameters
+    ----------
+    session: Session
+        Session the fixture is used by.
+    fixture: dict
+        A dictionary where keys are class objects and values are pandas
+        DataFrames with their rows.
+
+    Returns
+    -------
+    None
+
+    """
+    for class_obj, df in fixture.items():
+        name = class_obj.__tablename__
+        session.execute(
+            text(f'CREATE TEMP TABLE "{name}" (LIKE "{name}" INCLUDING DEFAULTS INCLUDING INDEXES)')
+        )
+        copy_rows(session, class_obj, df)
+        session.execute(text(f'ANALYZE "{name}"'))
+
+
+def generate_team_games(teams: int = 32, games: int = 82, seed: int = 0) -> dict:
+    """Generate random schedule of teams with their team stats.
+
+    Each round pairs all teams randomly (home and away team), one more
+    team has no game at all. About 5 % of team stats are missing.
+
+    Parameters
+    ----------
+    teams: int = 32
+        An integer representing number of teams with games (even).
+    games: int = 82
+        An integer representing number of games of each team.
+    seed: int = 0
+        An integer representing seed of random generator.
+
+    Returns
+    -------
+    dict
+        A dictionary where keys are Team, Game, TeamStat and TeamGame
+        class objects and values are pandas DataFrames with their rows.
+    """
+    rng = np.random.default_rng(seed)
+
+    tids = np.arange(1, teams + 2)
+    df_teams = pd.DataFrame(
+        {"tid": tids, "name": [f"Team {tid}" for tid in tids], "abbr": [f"T{tid:02d}" for tid in tids]}
+    )
+
+    # Round r is played on day r, pairs of teams are (away, home)
+    pairs = np.concatenate(
+        [rng.permutation(teams).reshape(-1, 2) + 1 for _ in range(games)]
+    )
+    size = len(pairs)
+    df_games = pd.DataFrame(
+        {
+            "gid": np.arange(1, size + 1),
+            "date": pd.Timestamp("2023-10-10")
+            + pd.to_timedelta(np.arange(size) // (teams // 2), unit="D"),
+            "atid": pairs[:, 0],
+            "atg": rng.poisson(3, size),
+            "htid": pairs[:, 1],
+            "htg": rng.poisson(3, size),
+            "end": rng.choice(["FT", "FT", "FT", "OT", "SO"], size),
+        }
+    )
+    # Tied games are decided in overtime or shootout
+    tied = df_games["atg"] == df_games["htg"]
+    df_games.loc[tied, "htg"] += 1
+    df_games.loc[tied, "end"] = "OT"
+
+    sides = []
+    for is_home, tid, opp_tid, gf, ga in (
+        (True, "htid", "atid", "htg", "atg"),
+        (False, "atid", "htid", "atg", "htg"),
+    ):
+        sides.append(
+            pd.DataFrame(
+                {
+                    "tid": df_games[tid],
+                    "gid": df_games["gid"],
+                    "date": df_games["date"],
+                    "is_home": is_home,
+                    "opp_tid": df_games[opp_tid],
+                    "gf": df_games[gf],
+                    "ga": df_games[ga],
+                    "end": df_games["end"],
+                }
+            )
+        )
+    df_team_games = pd.concat(sides, ignore_index=True).sort_values(["tid", "gid"])
+    df_team_games["result"] = np.where(
+        df_team_games["gf"] > df_team_games["ga"],
+        "W",
+        np.where(df_team_games["end"] == "FT", "L", "OTL"),
+    )
+    df_team_games["rest_days"] = (
+        df_team_games.groupby("tid")["date"].diff().dt.days.astype("Int64")
+    )
+    df_team_games = df_team_games.drop(columns="end").reset_index(drop=True)
+    df_games["date"] = df_games["date"].dt.date
+    df_team_games["date"] = df_team_games["date"].dt.date
+    df_team_games.insert(0, "tgid", np.arange(1, len(df_team_games) + 1))
+
+    df_team_stats = df_team_games[["tid", "gid"]].copy()
+    df_team_stats["g"] = df_team_games["gf"]
+    for column in ("a", "pts", "pim", "evg", "ppg", "shg"):
+        df_team_stats[column] = rng.poisson(2, len(df_team_stats))
+    df_team_stats["sog"] = rng.poisson(30, len(df_team_stats))
+    df_team_stats["sp"] = (df_team_stats["g"] / df_team_stats["sog"].clip(lower=1) * 100).round(1)
+    df_team_stats = df_team_stats[rng.random(len(df_team_stats)) >= 0.05]
+    df_team_stats.insert(0, "sid", np.arange(1, len(df_team_stats) + 1))
+
+    return {Team: df_teams, Game: df_games, TeamStat: df_team_stats, TeamGame: df_team_games}
+
+
+def check_team_last_win(
+    teams: int = 32, games: int = 82, last_n: int = DEFAULT_PARAMS["last_n"]
+) -> bool:
+    """Check team_last_win.sql against its reference computation on generated data.
+
+    Generated teams, games, team stats and team_game rows are copied
+    into temporary tables, nothing is committed.
+
+    Parameters
+    ----------
+    teams: int = 32
+        An integer representing number of teams with games.
+    games: int = 82
+        An integer representing number of games of each team.
+    last_n: int = DEFAULT_PARAMS["last_n"]
+        An integer representing number of last games.
+
+    Returns
+    -------
+    bool
+        True if the query returns the same averages as the reference.
+    """
+    fixture = generate_team_games(teams, games)
+    sql = read_sql_file(PSQL_DIR / "sog" / "team_last_win.sql")
+    params = dict(DEFAULT_PARAMS, last_n=last_n)
+
+    # Session is closed without commit, temporary tables are dropped
+    with Sess() as session:
+        copy_fixture(session, fixture)
+        explained = explain_sql(session, sql, params)
+        rows = session.execute(text(sql), bind_params(sql, params)).all()
+
+    # Teams without games have no averages within reference
+    df_games = fixture[Game]
+    result = pd.DataFrame([row._asdict() for row in rows]).drop(columns="abbr")
+    result = result[result["tid"].isin(df_games[["atid", "htid"]].stack())]
+
+    same = same_results(
+        result, reference_team_last_win(df_games, fixture[TeamStat], last_n), "tid"
+    )
+    logger.info(
+        f"sog/team_last_win.sql: {explained['execution_ms']:.2f} ms | {len(df_games)} games | {'OK' if same else 'DIFFERENT'}"
+    )
+
+    return same
+
+
+def generate_skater_stats(
+    players: int = 736, games: int = 82, seed: int = 0
+) -> tuple:
+    """Generate random players and their skater stats.
+
+    Players are split evenly into 32 teams, each player has a row in
+    every game of its team. Games of each team are listed in team_game
+    rows, last-N queries order them by date.
+
+    Parameters
+    ----------
+    players: int = 736
+        An integer representing number of players.
+    games: int = 82
+        An integer representing number of games of each team.
+    seed: int = 0
+        An integer representing seed of random generator.
+
+    Returns
+    -------
+    tuple
+        A tuple (df_players, df_stats, df_team_games) of pandas
+        DataFrames with columns of Player, SkaterStat and TeamGame
+        objects.
+    """
+    rng = np.random.default_rng(seed)
+
+    pids = np.arange(1, players + 1)
+    df_players = pd.DataFrame(
+        {"pid": pids, "name": [f"Player {pid}" for pid in pids], "pos": "F", "tid": pids % 32 + 1}
+    )
+
+    # Game k of team tid has gid k * 32 + tid (unique, increasing in time)
+    # and it is played on day k
+    df_team_games = pd.DataFrame({"tid": np.arange(1, 33)}).merge(
+        pd.DataFrame({"game": np.arange(games)}), how="cross"
+    )
+    df_team_games["gid"] = df_team_games["game"] * 32 + df_team_games["tid"]
+    df_team_games["date"] = (
+        pd.Timestamp("2023-10-10") + pd.to_timedelta(df_team_games["game"], unit="D")
+    ).dt.date
+    df_team_games["is_home"] = df_team_games["game"] % 2 == 0
+    df_team_games["opp_tid"] = df_team_games["tid"] % 32 + 1
+    df_team_games["gf"] = rng.poisson(3, len(df_team_games))
+    df_team_games["ga"] = rng.poisson(3, len(df_team_games))
+    df_team_games["result"] = np.where(df_team_games["gf"] > df_team_games["ga"], "W", "L")
+    df_team_games["rest_days"] = np.where(df_team_games["game"] > 0, 1, None)
+    df_team_games.insert(0, "tgid", np.arange(1, len(df_team_games) + 1))
+
+    df_stats = df_players[["pid", "tid"]].merge(
+        df_team_games[["tid", "gid"]], on="tid"
+    )
+    df_stats.insert(0, "sid", np.arange(1, len(df_stats) + 1))
+
+    size = len(df_stats)
+    for column in SkaterStat.__table__.c:
+        if column.name in df_stats or column.name in ("created", "updated"):
+            continue
+        if column.name == "pm":
+            df_stats[column.name] = rng.integers(-3, 4, size)
+        elif column.type.python_type is int:
+            df_stats[column.name] = rng.poisson(1.5, size)
+        elif column.type.python_type is float:
+            df_stats[column.name] = rng.random(size).round(3)
+        else:
+            # Time on ice between 5 and 25 minutes
+            df_stats[column.name] = pd.to_timedelta(rng.integers(300, 1500, size), unit="s")
+
+    return df_players, df_stats, df_team_games.drop(columns="game")
+
+
+def reference_player_modes(
+    df_stats: pd.DataFrame, last_n: int, team_id: Union[int, None] = None
+) -> pd.DataFrame:
+    """Reference computation of player last-N averages and modes.
+
+    Mode of each stat is its most common value within last N games of
+    the player, the lowest one if there are more of them (as mode()
+    aggregate of PostgreSQL ordered by the value).
+
+    Parameters
+    ----------
+    df_stats: pd.DataFrame
+        Pandas DataFrame with columns of SkaterStat object.
+    last_n: int
+        An integer representing number of last games.
+    team_id: Union[int, None] = None
+        An integer representing team whose stats are used only. If value
+        is not specified, default value is None -> stats of all teams.
+
+    Returns
+    -------
+    pd.DataFrame
+        Pandas DataFrame with pid, <stat>_avg and mode_<stat> columns.
+    """
+    if team_id is not None:
+        df_stats = df_stats[df_stats["tid"] == team_id]
+
+    last_games = df_stats.sort_values("gid", ascending=False).groupby("pid").head(last_n)
+    grouped = last_games.groupby("pid")
+
+    reference = pd.DataFrame(index=grouped.size().index)
+    for stat in MODE_STATS:
+        reference[f"{stat}_avg"] = grouped[stat].mean().round(2)
+        reference[f"mode_{stat}"] = grouped[stat].agg(lambda values: values.mode().min())
+    reference["min_sog"] = grouped["sog"].min()
+    reference["max_sog"] = grouped["sog"].max()
+
+    return reference.reset_index()
+
+
+def check_player_modes(
+    players: int = 736,
+    games: int = 82,
+    last_n: int = DEFAULT_PARAMS["last_n"],
+    team_id: int = DEFAULT_PARAMS["team_id"],
+) -> dict:
+    """Benchmark player last-N queries and check their modes on generated data.
+
+    Generated players, stats and team games are copied into temporary
+    player, skater_stat and team_game tables (see copy_fixture()),
+    nothing is committed.
+
+    Parameters
+    ----------
+    players: int = 736
+        An integer representing number of generated players.
+    games: int = 82
+        An integer representing number of games of each team.
+    last_n: int = DEFAULT_PARAMS["last_n"]
+        An integer representing number of last games.
+    team_id: int = DEFAULT_PARAMS["team_id"]
+        An integer representing team of player_last_stats.sql.
+
+    Returns
+    -------
+    dict
+        A dictionary where keys are names of SQL queries and values are
+        results of EXPLAIN ANALYZE with "same" key (True if the query
+        returns the same values as the reference).
+    """
+    df_players, df_stats, df_team_games = generate_skater_stats(players, games)
+    queries = {
+        "overview/player_lg_all.sql": None,
+        "sog/player_last_stats.sql": team_id,
+    }
+    params = dict(DEFAULT_PARAMS, last_n=last_n, team_id=team_id)
+
+    results = {}
+    # Session is closed without commit, temporary tables are dropped
+    with Sess() as session:
+        copy_fixture(
+            session, {Player: df_players, SkaterStat: df_stats, TeamGame: df_team_games}
+        )
+
+        for name, query_team_id in queries.items():
+            sql = read_sql_file(PSQL_DIR / name)
+            results[name] = explain_sql(session, sql, params)
+
+            rows = session.execute(text(sql), bind_params(sql, params)).all()
+            results[name]["same"] = same_results(
+                pd.DataFrame([row._asdict() for row in rows]),
+                reference_player_modes(df_stats, last_n, query_team_id),
+                "pid",
+            )
+            logger.info(
+                f"{name}: {results[name]['execution_ms']:.2f} ms | {len(df_stats)} rows | {'OK' if results[name]['same'] else 'DIFFERENT'}"
+            )
+
+    return results
+
+
+if __name__ == "__main__":
+    # Usage: python -m src.database.benchmark LABEL
+    #        python -m src.database.benchmark compare BEFORE AFTER
+    #        python -m src.database.benchmark check
+    if sys.argv[1] == "compare":
+        compare_benchmarks(sys.argv[2], sys.argv[3])
+    elif sys.argv[1] == "check":
+        print(f"team_last_win.sql: {'OK' if check_team_last_win() else 'DIFFERENT'}")
+        check_player_modes()
+    else:
+        print(run_benchmark(sys.argv[1]))
@@ -1,30 +1,289 @@
-from typing import Type
+import time
+from datetime import date
+from io import StringIO
+from typing import Type, Union
 
 import pandas as pd
-from sqlalchemy import select
+from sqlalchemy import select, exists, func, text, tuple_, literal_column, UniqueConstraint
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
 
+from config import NHL_SEASON, BULK_LOAD_MIN_ROWS
+from src.logging_setup import logger
 from src.session_config import Sess
 from src.database.decorators import timer
 
 from src.data_models.base import Base
 from src.data_models.game import Game
-from src.data_models.team import TeamStat, TeamStatAdvanced
+from src.data_models.team import TeamGame, TeamStat, TeamStatAdvanced
 from src.data_models.player import SkaterStat, SkaterStatAdvanced, GoalieStat
+from src.data_models.checkpoint import IngestCheckpoint
 
-from src.data_preprocessing.game_data import games_last
-from src.data_preprocessing.team_data import basic_team_stats, advanced_team_stats
+from src.data_preprocessing.game_data import (
+    STAT_TABLES,
+    games_last,
+    missing_games,
+    boxscore_link,
+    season_of,
+    game_index,
+)
+from src.data_preprocessing.team_data import (
+    game_basic_team_stats,
+    game_advanced_team_stats,
+)
 from src.data_preprocessing.player_data import (
-    basic_skater_stats,
-    advanced_skater_stats,
-    basic_goalie_stats,
+    parse_basic_skater_stats,
+    parse_advanced_skater_stats,
+    parse_basic_goalie_stats,
+    player_resolver,
+)
+from src.data_preprocessing.http_client import client
+from src.data_preprocessing.team_registry import team_registry
+from src.data_preprocessing.boxscore import (
+    BoxscorePage,
+    prefetch_boxscore_pages,
+    clear_boxscore_pages,
 )
 
 
+def natural_key(class_obj: Type[Base]) -> list:
+    """Columns of unique constraint identifying a row (e.g. gid, tid).
+
+    Parameters
+    ----------
+    class_obj: Type[Base]
+        Class object of SQLAlchemy ORM models derived from the
+        Base class.
+
+    Returns
+    -------
+    list
+        A list of column names. Empty list, if table has no unique
+        constraint.
+    """
+    for constraint in class_obj.__table__.constraints:
+        if isinstance(constraint, UniqueConstraint):
+            return [column.name for column in constraint.columns]
+    return []
+
+
+def copy_rows(
+    session: Session,
+    class_obj: Type[Base],
+    df: pd.DataFrame,
+    target: Union[str, None] = None,
+) -> None:
+    """Stream DataFrame into db table using COPY FROM STDIN.
+
+    COPY runs on the connection of the session, so it is a part of
+    the session transaction.
+
+    Parameters
+    ----------
+    session: Session
+        Session with open transaction.
+    class_obj: Type[Base]
+        Class object of SQLAlchemy ORM models derived from the
+        Base class.
+    df: pandas.DataFrame
+        Pandas DataFrame with columns matching the table columns.
+    target: Union[str, None] = None
+        A string representing name of table the rows are copied into
+        (e.g. staging table). If value is not specified, default value
+        is None -> table of class_obj.
+
+    Returns
+    -------
+    None
+
+    """
+    table = class_obj.__table__
+
+    # Integer columns with missing values are stored as floats by pandas,
+    # nullable integer dtype keeps them as integers in CSV (e.g. 3 not 3.0)
+    # Floats are rounded as PostgreSQL does when inserting them by ORM (svp)
+    df = df.copy()
+    for column in df.columns:
+        if table.c[column].type.python_type is int:
+            df[column] = pd.to_numeric(df[column]).round().astype("Int64")
+
+    # Empty (unquoted) CSV value is NULL
+    buffer = StringIO()
+    df.to_csv(buffer, index=False, header=False)
+    buffer.seek(0)
+
+    columns = ", ".join(f'"{column}"' for column in df.columns)
+
+    # Raw DBAPI (psycopg2) connection of the session transaction
+    dbapi_connection = session.connection().connection
+    with dbapi_connection.cursor() as cursor:
+        cursor.copy_expert(
+            f'COPY "{target or table.name}" ({columns}) FROM STDIN WITH (FORMAT csv)',
+            buffer,
+        )
+
+
+def upsert_copied_rows(
+    session: Session, class_obj: Type[Base], df: pd.DataFrame, key: list
+) -> tuple:
+    """Upsert DataFrame into db table using COPY into staging table.
+
+    Rows are copied into temporary staging table first and merged into
+    the table by INSERT ... ON CONFLICT DO UPDATE. Existing rows with
+    unchanged values are skipped.
+
+    Parameters
+    ----------
+    session: Session
+        Session with open transaction.
+    class_obj: Type[Base]
+        Class object of SQLAlchemy ORM models derived from the
+        Base class.
+    df: pandas.DataFrame
+        Pandas DataFrame with columns matching the table columns.
+    key: list
+        A list of column names of natural key (unique constraint).
+
+    Returns
+    -------
+    tuple
+        A tuple (inserted, updated) representing numbers of rows.
+    """
+    table = class_obj.__table__
+    staging = f"staging_{table.name}"
+
+    # Staging table is dropped at the end of the transaction
+    session.execute(
+        text(
+            f'CREATE TEMP TABLE "{staging}" (LIKE "{table.name}" INCLUDING DEFAULTS) ON COMMIT DROP'
+        )
+    )
+    copy_rows(session, class_obj, df, target=staging)
+
+    columns = ", ".join(f'"{column}"' for column in df.columns)
+    value_columns = [column for column in df.columns if column not in key]
+    updates = [f'"{column}" = EXCLUDED."{column}"' for column in value_columns]
+    if "updated" in table.c:
+        updates.append('"updated" = CURRENT_TIMESTAMP(0)')
+
+    # Rows are updated only if any value differs
+    changed = "({}) IS DISTINCT FROM ({})".format(
+        ", ".join(f'"{table.name}"."{column}"' for column in value_columns),
+        ", ".join(f'EXCLUDED."{column}"' for column in value_columns),
+    )
+
+    # xmax is 0 for inserted rows (no previous row version)
+    inserted_flags = session.scalars(
+        text(
+            f'INSERT INTO "{table.name}" ({columns}) SELECT {columns} FROM "{staging}" '
+            f'ON CONFLICT ({", ".join(key)}) DO UPDATE SET {", ".join(updates)} '
+            f"WHERE {changed} RETURNING (xmax = 0)"
+        )
+    ).all()
+
+    inserted = sum(inserted_flags)
+    return inserted, len(inserted_flags) - inserted
+
+
+def upsert_rows(
+    session: Session, class_obj: Type[Base], df: pd.DataFrame, key: list
+) -> tuple:
+    """Upsert DataFrame into db table using INSERT ... ON CONFLICT DO UPDATE.
+
+    Existing rows with unchanged values are skipped.
+
+    Parameters
+    ----------
+    session: Session
+        Session with open transaction.
+    class_obj: Type[Base]
+        Class object of SQLAlchemy ORM models derived from the
+        Base class.
+    df: pandas.DataFrame
+        Pandas DataFrame with columns matching the table columns.
+    key: list
+        A list of column names of natural key (unique constraint).
+
+    Returns
+    -------
+    tuple
+        A tuple (inserted, updated) representing numbers of rows.
+    """
+    table = class_obj.__table__
+
+    # Missing values (NaN) are stored as NULL
+    records = df.astype(object).where(df.notna(), None).to_dict(orient="records")
+    if not records:
+        return 0, 0
+
+    stmt = insert(class_obj).values(records)
+    value_columns = [column for column in df.columns if column not in key]
+    updates = {column: stmt.excluded[column] for column in value_columns}
+    if "updated" in table.c:
+        updates["updated"] = text("CURRENT_TIMESTAMP(0)")
+
+    # Rows are updated only if any value differs
+    changed = tuple_(*(table.c[column] for column in value_columns)).is_distinct_from(
+        tuple_(*(stmt.excluded[column] for column in value_columns))
+    )
+
+    # xmax is 0 for inserted rows (no previous row version)
+    inserted_flags = session.scalars(
+        stmt.on_conflict_do_update(
+            index_elements=key, set_=updates, where=changed
+        ).returning(literal_column("xmax = 0"))
+    ).all()
+
+    inserted = sum(inserted_flags)
+    return inserted, len(inserted_flags) - inserted
+
+
+def table_row_count(session: Session, class_obj: Type[Base]) -> tuple:
+    """Number of rows in db table.
+
+    Within PostgreSQL, planner's row estimate (pg_class.reltuples) is
+    used, so no row is read. Exact count(*) is used if table has not
+    been analyzed yet or within other databases.
+
+    Parameters
+    ----------
+    session: Session
+        Session with open transaction.
+    class_obj: Type[Base]
+        Class object of SQLAlchemy ORM models derived from the
+        Base class.
+
+    Returns
+    -------
+    tuple
+        A tuple (count, estimated) where estimated is True if count is
+        the planner's estimate.
+    """
+    if session.get_bind().dialect.name == "postgresql":
+        # reltuples is -1 (or 0 in older versions) for tables never analyzed
+        stmt = text(
+            "SELECT reltuples::bigint FROM pg_class WHERE oid = CAST(:table AS regclass)"
+        )
+        estimate = session.scalar(stmt, {"table": class_obj.__tablename__})
+        if estimate and estimate > 0:
+            return estimate, True
+
+    return session.scalar(select(func.count()).select_from(class_obj)), False
+
+
 @timer
-def populate_db_table(class_obj: Type[Base], df: pd.DataFrame) -> None:
+def populate_db_table(
+    class_obj: Type[Base], df: pd.DataFrame, upsert: bool = True
+) -> None:
     """Populate db table.
 
     Insert/append pandas DataFrame into PostgreSQL database table.
+    Large DataFrames (BULK_LOAD_MIN_ROWS rows or more) are streamed by
+    COPY FROM STDIN. Rows of tables with natural key (e.g. gid, tid)
+    are upserted by INSERT ... ON CONFLICT DO UPDATE, so importing the
+    same games again updates their rows instead of duplicating them.
+    Small DataFrames of other tables are imported as ORM objects. All
+    paths run within a single transaction.
 
     Parameters
     ----------
@@ -33,61 +292,347 @@ def populate_db_table(class_obj: Type[Base], df: pd.DataFrame) -> None:
         Base class.
     df: pandas.DataFrame
         Pandas DataFrame as input data to be imported.
+    upsert: bool = True
+        If True, existing rows with the same natural key are updated.
+        Otherwise, rows are inserted only (duplicates raise an error).
 
     Returns
     -------
     None
 
     """
-    # Convert DataFrame to list of dictionaries
-    data = df.to_dict(orient="records")
+    # Natural key of the table, empty if table has no unique constraint
+    key = natural_key(class_obj)
 
     # Construct Session with begin() method for handling each transaction
     # The transaction is automatically committed or rolled back when exiting the 'with' block
     with Sess.begin() as session:
         print(f"Importing data into {class_obj.__name__} object.")
-        # row is a dictionary containing key-value pairs where the keys correspond to column names
-        for row in data:
-            # Unpack dictionary with keys matching the attribute names of a class
-            # and create an instance of that class with the corresponding values
-            record = class_obj(**row)
-            session.add(record)
-        # Number of imported records
-        imported_count = len(data)
-        # Total number of records in db table
-        total_count = len(session.scalars(select(class_obj)).all())
+        start = time.perf_counter()
+
+        # COPY and ON CONFLICT are available within PostgreSQL only
+        postgresql = session.get_bind().dialect.name == "postgresql"
+
+        if postgresql and key and upsert:
+            # Rows with the same key within input data would conflict with each other
+            unique_df = df.drop_duplicates(subset=key, keep="last")
+            if len(unique_df) >= BULK_LOAD_MIN_ROWS:
+                method = "COPY upsert"
+                inserted, updated = upsert_copied_rows(session, class_obj, unique_df, key)
+            else:
+                method = "upsert"
+                inserted, updated = upsert_rows(session, class_obj, unique_df, key)
+        elif postgresql and len(df) >= BULK_LOAD_MIN_ROWS:
+            method = "COPY"
+            copy_rows(session, class_obj, df)
+            inserted, updated = len(df), 0
+        else:
+            method = "ORM"
+            # row is a dictionary containing key-value pairs where the keys correspond to column names
+            for row in df.to_dict(orient="records"):
+                # Unpack dictionary with keys matching the attribute names of a class
+                # and create an instance of that class with the corresponding values
+                session.add(class_obj(**row))
+            session.flush()
+            inserted, updated = len(df), 0
+
+        seconds = time.perf_counter() - start
+
+        # Input rows neither inserted nor updated (duplicated or unchanged)
+        skipped = len(df) - inserted - updated
+        # Total number of records in db table (constant memory)
+        total_count, estimated = table_row_count(session, class_obj)
 
         print(
-            f"Imported records: {imported_count}",
-            f"Total records in db table: {total_count}",
+            f"Imported records: {len(df)} ({method}, {len(df) / seconds if seconds else 0:.0f} rows/s)",
+            f"Inserted: {inserted} | Updated: {updated} | Skipped: {skipped}",
+            f"Total records in db table: {'~' if estimated else ''}{total_count}",
             sep="\n",
         )
 
 
+def game_stats(
+    page: BoxscorePage,
+    gid: int,
+    atid: int,
+    htid: int,
+    season: int = NHL_SEASON,
+    session: Union[Session, None] = None,
+) -> dict:
+    """Prepare stats of all stat tables from a single game.
+
+    Boxscore page of the game is visited only once and all stat
+    tables are derived from it. New players of the game are added
+    into player table by a single insert.
+
+    Parameters
+    ----------
+    page: BoxscorePage
+        Boxscore page of the game.
+    gid: int
+        An integer representing unique game identifier.
+    atid: int
+        An integer representing unique identifier of away team.
+    htid: int
+        An integer representing unique identifier of home team.
+    season: int = NHL_SEASON
+        An integer representing season of the game (rosters of new
+        players). If value is not specified, current season is used.
+    session: Union[Session, None] = None
+        Session of the game transaction, new players are added within
+        it. If value is not specified, default value is None -> new
+        players are committed by own transaction.
+
+    Returns
+    -------
+    dict
+        A dictionary where keys are class objects of stat tables and
+        values are pandas DataFrames with stats of the game.
+    """
+    skater_stats = parse_basic_skater_stats(page, gid, atid, htid)
+    skater_advanced_stats = parse_advanced_skater_stats(page, gid, atid, htid)
+    goalie_stats = parse_basic_goalie_stats(page, gid, atid, htid)
+
+    # New players of the game (both teams) are added at once
+    player_resolver.add_missing(
+        pd.concat([skater_stats, skater_advanced_stats, goalie_stats]),
+        season,
+        session,
+    )
+
+    return {
+        TeamStat: game_basic_team_stats(page, gid, atid, htid),
+        TeamStatAdvanced: game_advanced_team_stats(page, gid, atid, htid),
+        SkaterStat: player_resolver.resolve(skater_stats, season, session),
+        SkaterStatAdvanced: player_resolver.resolve(
+            skater_advanced_stats, season, session
+        ),
+        GoalieStat: player_resolver.resolve(goalie_stats, season, session),
+    }
+
+
+def team_games(session: Session, game: Game) -> list:
+    """Prepare rows of TeamGame object (home and away team) of a single game.
+
+    Rest days are counted from the latest previous game of each team
+    already stored within TeamGame object. Rest days of the following
+    stored game of each team (e.g. games of a later season ingested
+    before a backfill of an older one) are counted again from this game.
+
+    Parameters
+    ----------
+    session: Session
+        Session of the transaction importing the game.
+    game: Game
+        Game object with assigned gid (flushed).
+
+    Returns
+    -------
+    list
+        A list of two TeamGame objects.
+    """
+    game_date = date.fromisoformat(str(game.date)[:10])
+
+    rows = []
+    for tid, opp_tid, gf, ga, is_home in (
+        (game.htid, game.atid, game.htg, game.atg, True),
+        (game.atid, game.htid, game.atg, game.htg, False),
+    ):
+        # Previous game of the team (rows of the team are found by tid index)
+        previous = session.scalar(
+            select(func.max(TeamGame.date)).where(
+                TeamGame.tid == tid, TeamGame.date < game_date
+            )
+        )
+
+        # Following game of the team gets rest days counted from this game
+        following = session.scalars(
+            select(TeamGame)
+            .where(TeamGame.tid == tid, TeamGame.date > game_date)
+            .order_by(TeamGame.date, TeamGame.gid)
+            .limit(1)
+        ).first()
+        if following is not None:
+            following.rest_days = (following.date - game_date).days
+
+        if gf > ga:
+            result = "W"
+        else:
+            # Loss after regulation time (OT, SO) gives a point
+            result = "L" if game.end == "FT" else "OTL"
+
+        rows.append(
+            TeamGame(
+                tid=tid,
+                gid=game.gid,
+                date=game_date,
+                is_home=is_home,
+                opp_tid=opp_tid,
+                gf=int(gf),
+                ga=int(ga),
+                result=result,
+                rest_days=(game_date - previous).days if previous else None,
+            )
+        )
+
+    return rows
+
+
 @timer
-def update_all_tables() -> None:
-    """Update all database tables.
+def ingest_games(df: pd.DataFrame, season: int = NHL_SEASON) -> None:
+    """Import new games together with all their stats.
+
+    Each game is visited only once. Game row, rows of all stat tables
+    (team, skater, goalie), team_game rows and checkpoint of the game
+    are committed together within one transaction, so a game is never
+    stored without its stats and an interrupted run can be resumed
+    after the last committed game. Boxscore pages of following games
+    are fetched meanwhile.
+
+    Parameters
+    ----------
+    df: pandas.DataFrame
+        Pandas DataFrame representing new games (output of games_last()).
+    season: int = NHL_SEASON
+        An integer representing season of the games. If value is not
+        specified, current season is used.
+
+    Returns
+    -------
+    None
 
-    Scrape all missing data and insert them into game,
-    team and player tables (skater, goalie).
     """
-    # Append last games stats
-    populate_db_table(Game, games_last())
+    # Convert DataFrame to list of dictionaries
+    data = df.to_dict(orient="records")
+
+    # Date is in format YYYY-MM-DD, boxscore link requires YYYYMMDD
+    links = [
+        boxscore_link(str(row["date"]).replace("-", ""), team_registry.abbr(row["htid"]))
+        for row in data
+    ]
+
+    # Following boxscore pages are fetched while current game is imported
+    # Each page is visited only once, so it is not kept after the game is imported
+    for idx, (row, link, page) in enumerate(
+        zip(data, links, prefetch_boxscore_pages(links, cache=False)), start=1
+    ):
+        try:
+            with Sess.begin() as session:
+                game = Game(**row)
+                session.add(game)
+                # Flush the game to get its gid
+                session.flush()
+
+                logger.info(
+                    f"Ingesting {idx}/{len(data)} game ({game.gid}) | {team_registry.abbr(game.atid)} x {team_registry.abbr(game.htid)}..."
+                )
+
+                # New players are added within the game transaction as well
+                for class_obj, df_stats in game_stats(
+                    page, game.gid, game.atid, game.htid, season, session
+                ).items():
+                    for stats_row in df_stats.to_dict(orient="records"):
+                        session.add(class_obj(**stats_row))
+
+                # Game from the point of view of both teams
+                session.add_all(team_games(session, game))
+
+                # Mark the game as done within the same transaction
+                session.add(IngestCheckpoint(season=season, link=link, gid=game.gid))
+                gid = game.gid
+        except Exception:
+            # Players added by the rolled back game are not stored
+            player_resolver.clear()
+            raise
+
+        # Committed game is available to following scrapers without reloading
+        game_index.add(
+            gid, row["date"], row["atid"], row["htid"], team_registry.abbr(row["htid"])
+        )
+
+    print(f"Imported games: {len(data)}")
+
+
+@timer
+def fill_missing_stats(num_games: Union[int, None] = None) -> None:
+    """Import stats of stored games missing rows in any stat table.
 
-    # Append last basic team stats
-    populate_db_table(TeamStat, basic_team_stats())
+    Boxscore page of each game is visited only once. Rows of stat tables
+    still missing the game and checkpoint of the game are committed
+    together within one transaction (as by ingest_games()), so a filled
+    game is not scraped again, even if its page has no rows for some of
+    the tables. Boxscore pages of following games are fetched meanwhile.
 
-    # Append last advanced team stats
-    populate_db_table(TeamStatAdvanced, advanced_team_stats())
+    Parameters
+    ----------
+    num_games: Union[int, None] = None
+        An integer representing maximum number of games. If value is not
+        specified, default value is None -> all games missing stats.
+
+    Returns
+    -------
+    None
+
+    """
+    # Indexes: 0-gid, 1-date, 2-atid, 3-htid, 4-htid abbr
+    game_data = missing_games(num_games=num_games)
+    links = [boxscore_link(data[1], data[4]) for data in game_data]
+
+    for idx, (data, link, page) in enumerate(
+        zip(game_data, links, prefetch_boxscore_pages(links, cache=False)), start=1
+    ):
+        gid, atid, htid = data[0], data[2], data[3]
+        season = season_of(data[1])
+        logger.info(
+            f"Filling missing stats {idx}/{len(game_data)} of game ({gid}) | {team_registry.abbr(atid)} x {team_registry.abbr(htid)}..."
+        )
+
+        try:
+            with Sess.begin() as session:
+                # Stat tables without any row of the game (unique key index starts with gid)
+                missing = {
+                    class_obj
+                    for class_obj in STAT_TABLES
+                    if not session.scalar(select(exists().where(class_obj.gid == gid)))
+                }
+
+                # New players are added within the game transaction as well
+                for class_obj, df_stats in game_stats(
+                    page, gid, atid, htid, season, session
+                ).items():
+                    if class_obj in missing:
+                        upsert_rows(session, class_obj, df_stats, natural_key(class_obj))
+
+                # Mark the game as done within the same transaction
+                session.add(IngestCheckpoint(season=season, link=link, gid=gid))
+        except Exception:
+            # Players added by the rolled back game are not stored
+            player_resolver.clear()
+            raise
+
+    print(f"Filled games: {len(game_data)}")
+
+
+@timer
+def update_all_tables() -> None:
+    """Update all database tables.
+
+    Scrape all missing games and insert them into game, team and
+    player tables (skater, goalie). Boxscore page of each game is
+    visited only once and the game is stored together with all
+    its stats. Stored games still missing rows in any stat table are
+    filled in afterwards.
+    """
+    # Append last games with their stats
+    ingest_games(games_last())
 
-    # Append last basic skater stats
-    populate_db_table(SkaterStat, basic_skater_stats())
+    # Stored games still missing some of their stats
+    fill_missing_stats()
 
-    # Append last advanced skater stats
-    populate_db_table(SkaterStatAdvanced, advanced_skater_stats())
+    # Release boxscore pages downloaded within this run
+    clear_boxscore_pages()
 
-    # Append last basic goalie stats
-    populate_db_table(GoalieStat, basic_goalie_stats())
+    logger.info(f"HTTP requests: {client.stats()}")
 
 
 if __name__ == "__main__":
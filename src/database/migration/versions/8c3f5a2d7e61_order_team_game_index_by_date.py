@@ -0,0 +1,55 @@
+"""Order team_game index by date
+
+Revision ID: 8c3f5a2d7e61
+Revises: d2b7c4e81f90
+Create Date: 2026-10-16 23:14:52.306417
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8c3f5a2d7e61'
+down_revision: Union[str, None] = 'd2b7c4e81f90'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Last-N queries order games of a team by (date, gid), gid is not in
+    # date order for backfilled seasons
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_team_game_tid_date_gid',
+            'team_game',
+            ['tid', 'date', 'gid'],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            'ix_team_game_tid_gid',
+            table_name='team_game',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_team_game_tid_gid',
+            'team_game',
+            ['tid', 'gid'],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            'ix_team_game_tid_date_gid',
+            table_name='team_game',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
@@ -0,0 +1,55 @@
+"""Add last-N composite indexes
+
+Revision ID: a4d9f62b3e15
+Revises: 71f0a3c9e2d4
+Create Date: 2026-10-16 15:02:41.118306
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a4d9f62b3e15'
+down_revision: Union[str, None] = '71f0a3c9e2d4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Index name, table name, columns (btree is scanned backward for gid DESC)
+INDEXES = [
+    ('ix_game_htid_gid', 'game', ['htid', 'gid']),
+    ('ix_game_atid_gid', 'game', ['atid', 'gid']),
+    ('ix_team_stat_tid_gid', 'team_stat', ['tid', 'gid']),
+    ('ix_team_stat_advanced_tid_gid', 'team_stat_advanced', ['tid', 'gid']),
+    ('ix_skater_stat_pid_gid', 'skater_stat', ['pid', 'gid']),
+    ('ix_skater_stat_tid_gid', 'skater_stat', ['tid', 'gid']),
+    ('ix_skater_stat_advanced_pid_gid', 'skater_stat_advanced', ['pid', 'gid']),
+    ('ix_goalie_stat_pid_gid', 'goalie_stat', ['pid', 'gid']),
+]
+
+
+def upgrade() -> None:
+    # CREATE INDEX CONCURRENTLY does not block writes of running scrapers,
+    # but it cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.create_index(
+                name,
+                table,
+                columns,
+                unique=False,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(
+                name,
+                table_name=table,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
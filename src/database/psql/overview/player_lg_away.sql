@@ -22,7 +22,7 @@ WITH last_n_away_games AS (
             sk.a, 
             sk.ppa,
             sk.pm,
-            ROW_NUMBER() OVER (PARTITION BY sk.tid ORDER BY sk.gid DESC) AS rn
+            ROW_NUMBER() OVER (PARTITION BY sk.tid ORDER BY g.date DESC, sk.gid DESC) AS rn
         FROM 
             skater_stat sk
         JOIN 
@@ -65,4 +65,4 @@ overall_stats AS (
         p.name
 )
 SELECT * FROM overall_stats
-ORDER BY :order_by DESC;
+ORDER BY sog_avg DESC;
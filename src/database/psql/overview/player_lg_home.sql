@@ -22,7 +22,7 @@ WITH last_n_home_games AS (
             s.a, 
             s.ppa,
             s.pm,
-            ROW_NUMBER() OVER (PARTITION BY s.tid ORDER BY s.gid DESC) AS rn
+            ROW_NUMBER() OVER (PARTITION BY s.tid ORDER BY g.date DESC, s.gid DESC) AS rn
         FROM 
             skater_stat s
         JOIN 
@@ -69,4 +69,4 @@ SELECT
 FROM 
   overall_stats
 ORDER BY
-  :order_by DESC;
+  sog_avg DESC;
@@ -0,0 +1,78 @@
+-- All/home/away overviews of players by a single scan of skater_stat,
+-- each row of last N games is counted within "all" split and within
+-- its "home" or "away" split
+WITH player_games AS (
+    SELECT 
+        s.pid, 
+        s.gid, 
+        s.sog,
+        s.pts,
+        s.g, 
+        s.ppg,
+        s.a, 
+        s.ppa,
+        s.pm,
+        CASE WHEN tg.is_home THEN 'home' ELSE 'away' END AS side,
+        ROW_NUMBER() OVER (PARTITION BY s.pid ORDER BY tg.date DESC, s.gid DESC) AS rn_all,
+        ROW_NUMBER() OVER (PARTITION BY s.pid, tg.is_home ORDER BY tg.date DESC, s.gid DESC) AS rn_side
+    FROM 
+        skater_stat s
+    JOIN 
+        team_game tg ON 
+        s.gid = tg.gid AND 
+        s.tid = tg.tid
+),
+last_n_games AS (
+    SELECT 
+        sp.split,
+        pg.*
+    FROM 
+        player_games pg
+    CROSS JOIN LATERAL (
+        VALUES 
+          ('all', pg.rn_all), 
+          (pg.side, pg.rn_side)
+    ) AS sp(split, rn)
+    WHERE 
+        sp.rn <= :last_n
+),
+overall_stats AS (
+    SELECT 
+        ls.split,
+        p.pid, 
+        p.tid,
+        p.name, 
+        ROUND(avg(ls.sog), 2) AS sog_avg,
+        mode() WITHIN GROUP (ORDER BY ls.sog) AS mode_sog,
+        MIN(ls.sog) AS min_sog,
+        MAX(ls.sog) AS max_sog,
+        ROUND(avg(ls.pts), 2) AS pts_avg,
+        MIN(ls.pts) AS min_pts,
+        mode() WITHIN GROUP (ORDER BY ls.pts) AS mode_pts,
+        ROUND(avg(ls.g), 2) AS g_avg,
+        mode() WITHIN GROUP (ORDER BY ls.g) AS mode_g,
+        ROUND(avg(ls.ppg), 2) AS ppg_avg,
+        mode() WITHIN GROUP (ORDER BY ls.ppg) AS mode_ppg,
+        ROUND(avg(ls.a), 2) AS a_avg,
+        mode() WITHIN GROUP (ORDER BY ls.a) AS mode_a,
+        ROUND(avg(ls.ppa), 2) AS ppa_avg,
+        mode() WITHIN GROUP (ORDER BY ls.ppa) AS mode_ppa,
+        ROUND(avg(ls.pm), 2) AS pm_avg,
+        mode() WITHIN GROUP (ORDER BY ls.pm) AS mode_pm
+    FROM 
+        player p
+    JOIN 
+        last_n_games ls ON p.pid = ls.pid
+    GROUP BY 
+        ls.split,
+        p.pid, 
+        p.tid,
+        p.name
+)
+SELECT
+  * 
+FROM 
+  overall_stats
+ORDER BY
+  split, 
+  pid;
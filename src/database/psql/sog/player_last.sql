@@ -5,14 +5,18 @@ WITH last_n_games AS (
     sog
   FROM (
     SELECT 
-      pid, 
-      gid, 
+      s.pid, 
+      s.gid, 
       sog, 
-      ROW_NUMBER() OVER (PARTITION BY pid ORDER BY gid DESC) AS rn
+      ROW_NUMBER() OVER (PARTITION BY s.pid ORDER BY tg.date DESC, s.gid DESC) AS rn
     FROM 
-      skater_stat
+      skater_stat s
+    JOIN 
+      team_game tg ON 
+      s.gid = tg.gid AND 
+      s.tid = tg.tid
     WHERE 
-      tid = :team_id 
+      s.tid = :team_id 
     ) sub
       WHERE 
         rn <= :last_n 
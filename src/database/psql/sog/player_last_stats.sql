@@ -8,18 +8,11 @@ WITH last_n_games AS (
       ppg,
       a, 
       ppa,
-      pm,
-      FIRST_VALUE(sog) OVER (PARTITION BY pid ORDER BY COUNT(*) DESC) AS mode_sog,
-      FIRST_VALUE(pts) OVER (PARTITION BY pid ORDER BY COUNT(*) DESC) AS mode_pts,
-      FIRST_VALUE(g) OVER (PARTITION BY pid ORDER BY COUNT(*) DESC) AS mode_g,
-      FIRST_VALUE(ppg) OVER (PARTITION BY pid ORDER BY COUNT(*) DESC) AS mode_ppg,
-      FIRST_VALUE(a) OVER (PARTITION BY pid ORDER BY COUNT(*) DESC) AS mode_a,
-      FIRST_VALUE(ppa) OVER (PARTITION BY pid ORDER BY COUNT(*) DESC) AS mode_ppa,
-      FIRST_VALUE(pm) OVER (PARTITION BY pid ORDER BY COUNT(*) DESC) AS mode_pm
+      pm
     FROM (
       SELECT 
-        pid, 
-        gid,
+        s.pid, 
+        s.gid,
         sog,
         pts, 
         g, 
@@ -27,45 +20,41 @@ WITH last_n_games AS (
         a, 
         ppa,
         pm, 
-        ROW_NUMBER() OVER (PARTITION BY pid ORDER BY gid DESC) AS rn
+        ROW_NUMBER() OVER (PARTITION BY s.pid ORDER BY tg.date DESC, s.gid DESC) AS rn
       FROM 
-        skater_stat
+        skater_stat s
+      JOIN 
+        team_game tg ON 
+        s.gid = tg.gid AND 
+        s.tid = tg.tid
       WHERE 
-        tid = :team_id 
+        s.tid = :team_id 
     ) sub
     WHERE 
       rn <= :last_n 
-    GROUP BY 
-      pid, 
-      gid,
-      sog, 
-      pts, 
-      g, 
-      ppg,
-      a, 
-      ppa,
-      pm
 ),
 overall_stats AS (
+    -- Most common value of each stat is computed by mode() aggregate
+    -- within the group of player (ties -> the lowest value)
     SELECT 
       p.pid, 
       p.name, 
       ROUND(avg(ls.sog), 2) AS sog_avg,
-      ls.mode_sog,
+      mode() WITHIN GROUP (ORDER BY ls.sog) AS mode_sog,
       MIN(ls.sog) AS min_sog,
       MAX(ls.sog) AS max_sog,
       ROUND(avg(ls.pts), 2) AS pts_avg,
-      ls.mode_pts,
+      mode() WITHIN GROUP (ORDER BY ls.pts) AS mode_pts,
       ROUND(avg(ls.g), 2) AS g_avg,
-      ls.mode_g,
+      mode() WITHIN GROUP (ORDER BY ls.g) AS mode_g,
       ROUND(avg(ls.ppg), 2) AS ppg_avg,
-      ls.mode_ppg,
+      mode() WITHIN GROUP (ORDER BY ls.ppg) AS mode_ppg,
       ROUND(avg(ls.a), 2) AS a_avg,
-      ls.mode_a,
+      mode() WITHIN GROUP (ORDER BY ls.a) AS mode_a,
       ROUND(avg(ls.ppa), 2) AS ppa_avg,
-      ls.mode_ppa,
+      mode() WITHIN GROUP (ORDER BY ls.ppa) AS mode_ppa,
       ROUND(avg(ls.pm), 2) AS pm_avg,
-      ls.mode_pm
+      mode() WITHIN GROUP (ORDER BY ls.pm) AS mode_pm
     FROM 
       player p
     JOIN 
@@ -73,14 +62,7 @@ overall_stats AS (
       p.pid = ls.pid
     GROUP BY 
       p.pid, 
-      p.name, 
-      ls.mode_sog,
-      ls.mode_pts, 
-      ls.mode_g, 
-      ls.mode_ppg, 
-      ls.mode_a, 
-      ls.mode_ppa,
-      ls.mode_pm
+      p.name
 )
 SELECT * FROM overall_stats
 ORDER BY sog_avg DESC;
@@ -1,33 +1,28 @@
-WITH last_n_games AS (
-  SELECT 
-    tid, 
-    gid, 
-    sog
-  FROM (
-    SELECT 
-      tid, 
-      gid, 
-      sog, 
-      ROW_NUMBER() OVER (PARTITION BY tid ORDER BY gid DESC) AS rn
-    FROM 
-      team_stat
-    ) sub
-    WHERE 
-      rn <= :last_n 
-)
-
+-- Last N games of each team are read by (tid, date, gid) index of team_game
 SELECT 
   t.tid, 
   t.abbr, 
-  ROUND(AVG(ls.sog), 2) AS avg_last_n_games
+  ROUND(AVG(ts.sog), 2) AS avg_last_n_games
 FROM 
   team t
+CROSS JOIN LATERAL (
+  SELECT 
+    tg.gid
+  FROM 
+    team_game tg
+  WHERE 
+    tg.tid = t.tid
+  ORDER BY 
+    tg.date DESC,
+    tg.gid DESC
+  LIMIT :last_n
+) lg
 JOIN 
-  last_n_games ls ON 
-  t.tid = ls.tid
+  team_stat ts ON 
+  lg.gid = ts.gid AND 
+  t.tid = ts.tid
 GROUP BY 
   t.tid, 
   t.abbr
 ORDER BY 
   avg_last_n_games DESC;
-  
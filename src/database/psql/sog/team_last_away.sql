@@ -1,34 +1,27 @@
-WITH last_n_away_games AS (
-  SELECT 
-    atid AS tid, 
-    gid
-  FROM (
-    SELECT 
-      atid, 
-      gid, 
-      ROW_NUMBER() OVER (PARTITION BY atid ORDER BY gid DESC) AS rn
-        FROM 
-          game
-        WHERE 
-          atid IS NOT NULL
-    ) sub
-    WHERE 
-      rn <= :last_n 
-)
-
+-- Last N away games of each team are read by (tid, date, gid) index of team_game
 SELECT 
   t.tid, 
   t.abbr, 
   ROUND(AVG(ts.sog), 2) AS avg_last_n_away_games
 FROM 
   team t
-JOIN 
-  last_n_away_games lg ON 
-  t.tid = lg.tid
+CROSS JOIN LATERAL (
+  SELECT 
+    tg.gid
+  FROM 
+    team_game tg
+  WHERE 
+    tg.tid = t.tid AND 
+    NOT tg.is_home
+  ORDER BY 
+    tg.date DESC,
+    tg.gid DESC
+  LIMIT :last_n
+) lg
 JOIN 
   team_stat ts ON 
   lg.gid = ts.gid AND 
-  lg.tid = ts.tid
+  t.tid = ts.tid
 GROUP BY 
   t.tid, 
   t.abbr
@@ -1,76 +1,48 @@
-WITH last_n_games AS (
-  SELECT 
-    tid,
-    gid, 
-    sog, 
-    sp, 
-    g, 
-    ppg, 
-    pim,
-    FIRST_VALUE(sog) OVER (PARTITION BY tid ORDER BY COUNT(*) DESC) AS mode_sog,
-    FIRST_VALUE(sp) OVER (PARTITION BY tid ORDER BY COUNT(*) DESC) AS mode_sp,
-    FIRST_VALUE(g) OVER (PARTITION BY tid ORDER BY COUNT(*) DESC) AS mode_g,
-    FIRST_VALUE(ppg) OVER (PARTITION BY tid ORDER BY COUNT(*) DESC) AS mode_ppg,
-    FIRST_VALUE(pim) OVER (PARTITION BY tid ORDER BY COUNT(*) DESC) AS mode_pim
-  FROM (
-    SELECT 
-      tid, 
-      gid, 
-      sog, 
-      sp, 
-      g, 
-      ppg, 
-      pim, 
-      ROW_NUMBER() OVER (PARTITION BY tid ORDER BY gid DESC) AS rn
-    FROM 
-      team_stat
-    WHERE 
-      tid IS NOT NULL
-    ) sub
-      WHERE 
-        rn <= :last_n
-      GROUP BY 
-        tid, 
-        gid, 
-        sog, 
-        sp, 
-        g, 
-        ppg, 
-        pim
-),
-overall_stats AS (
+WITH overall_stats AS (
+    -- Last N games of each team are read by (tid, date, gid) index of
+    -- team_game, each game is joined to its single team_stat row,
+    -- most common value of each stat is computed by mode() aggregate
+    -- within the group of team (ties -> the lowest value)
     SELECT 
       t.tid, 
       t.abbr, 
       ROUND(avg(lg.sog), 2) AS sog_avg,
-      lg.mode_sog,
+      mode() WITHIN GROUP (ORDER BY lg.sog) AS mode_sog,
       MIN(lg.sog) AS min_sog,
       MAX(lg.sog) AS max_sog,
       avg(lg.sp) AS sp_avg,
-      lg.mode_sp,
+      mode() WITHIN GROUP (ORDER BY lg.sp) AS mode_sp,
       ROUND(avg(lg.g), 2) AS g_avg,
-      lg.mode_g,
+      mode() WITHIN GROUP (ORDER BY lg.g) AS mode_g,
       ROUND(avg(lg.ppg), 2) AS ppg_avg,
-      lg.mode_ppg,
+      mode() WITHIN GROUP (ORDER BY lg.ppg) AS mode_ppg,
       ROUND(avg(lg.pim), 2) AS pim_avg,
-      lg.mode_pim
+      mode() WITHIN GROUP (ORDER BY lg.pim) AS mode_pim
     FROM 
       team t
-    JOIN 
-      last_n_games lg ON 
-      t.tid = lg.tid
-    JOIN 
-      team_stat ts ON 
-      lg.gid = ts.gid AND 
-      lg.tid = ts.tid
+    CROSS JOIN LATERAL (
+      SELECT 
+        ts.sog, 
+        ts.sp, 
+        ts.g, 
+        ts.ppg, 
+        ts.pim
+      FROM 
+        team_game tg
+      JOIN 
+        team_stat ts ON 
+        tg.gid = ts.gid AND 
+        tg.tid = ts.tid
+      WHERE 
+        tg.tid = t.tid
+      ORDER BY 
+        tg.date DESC,
+        tg.gid DESC
+      LIMIT :last_n
+    ) lg
     GROUP BY 
       t.tid, 
-      t.abbr, 
-      lg.mode_sog, 
-      lg.mode_sp, 
-      lg.mode_g, 
-      lg.mode_ppg, 
-      lg.mode_pim
+      t.abbr
 )
 SELECT 
   * 
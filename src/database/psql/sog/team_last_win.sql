@@ -1,52 +1,50 @@
-WITH last_n_home_games AS (
+-- Last N home and last N away games of each team are read by (tid, date,
+-- gid) index of team_game, each game is joined to its single team_stat row
+SELECT 
+  t.tid, 
+  t.abbr, 
+  ROUND(AVG(ts.sog) FILTER (WHERE lg.is_home), 2) AS avg_last_n_home_games,
+  ROUND(AVG(ts.sog) FILTER (WHERE NOT lg.is_home), 2) AS avg_last_n_away_games
+FROM 
+  team t
+LEFT JOIN LATERAL (
+  (
     SELECT 
-        htid AS tid
-    FROM (
-        SELECT 
-            htid, 
-            ROW_NUMBER() OVER (PARTITION BY htid ORDER BY gid DESC) AS rn
-        FROM 
-          game
-        WHERE 
-          htid IS NOT NULL
-    ) sub
+      tg.gid, 
+      tg.is_home
+    FROM 
+      team_game tg
     WHERE 
-      rn <= :last_n
-),
-last_n_away_games AS (
+      tg.tid = t.tid AND 
+      tg.is_home
+    ORDER BY 
+      tg.date DESC,
+      tg.gid DESC
+    LIMIT :last_n
+  )
+  UNION ALL
+  (
     SELECT 
-        atid AS tid
-    FROM (
-      SELECT 
-        atid, 
-        ROW_NUMBER() OVER (PARTITION BY atid ORDER BY gid DESC) AS rn
-      FROM 
-        game
-      WHERE 
-        atid IS NOT NULL
-    ) sub
+      tg.gid, 
+      tg.is_home
+    FROM 
+      team_game tg
     WHERE 
-      rn <= :last_n 
-)
-SELECT 
-    t.tid, 
-    t.abbr, 
-    ROUND(AVG(CASE WHEN lg.tid IS NOT NULL THEN ts.sog END), 2) AS avg_last_n_home_games,
-    ROUND(AVG(CASE WHEN la.tid IS NOT NULL THEN ts.sog END), 2) AS avg_last_n_away_games
-FROM 
-    team t
-LEFT JOIN 
-    last_n_home_games lg ON 
-    t.tid = lg.tid
-LEFT JOIN 
-    last_n_away_games la ON 
-    t.tid = la.tid
+      tg.tid = t.tid AND 
+      NOT tg.is_home
+    ORDER BY 
+      tg.date DESC,
+      tg.gid DESC
+    LIMIT :last_n
+  )
+) lg ON 
+  TRUE
 LEFT JOIN 
-    team_stat ts ON 
-    lg.tid = ts.tid OR 
-    la.tid = ts.tid
+  team_stat ts ON 
+  lg.gid = ts.gid AND 
+  t.tid = ts.tid
 GROUP BY 
-    t.tid, 
-    t.abbr
+  t.tid, 
+  t.abbr
 ORDER BY 
-    avg_last_n_home_games DESC;
+  avg_last_n_home_games DESC;
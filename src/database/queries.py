@@ -1,8 +1,10 @@
-from typing import Type
+from pathlib import Path
+from typing import List, Type
 
-from sqlalchemy import select, func, desc
+import pandas as pd
+from sqlalchemy import select, func, desc, text
 
-from src.session_config import Session
+from src.session_config import Sess
 
 from src.data_models.base import Base
 from src.data_models.game import Game
@@ -10,7 +12,7 @@ from src.data_models.team import Team, TeamStat
 
 
 def select_all(class_obj: Type[Base]):
-    with Session.begin() as session:
+    with Sess.begin() as session:
         stmt = select(class_obj)
         all_data = session.execute(stmt)
         for row in all_data.scalars():
@@ -18,7 +20,7 @@ def select_all(class_obj: Type[Base]):
 
 
 def select_join():
-    with Session.begin() as session:
+    with Sess.begin() as session:
         stmt = (
             select(Team.abbr)
             .join(Game, Team.tid == Game.atid)
@@ -29,7 +31,7 @@ def select_join():
             print(abbr)
 
 def select_team():
-    with Session.begin() as session:
+    with Sess.begin() as session:
         stmt = (
             select(Team.tid)
             .where(Team.abbr == 'BUF')
@@ -40,7 +42,7 @@ def select_team():
 
 
 def avg_team_sog():
-    with Session.begin() as session:
+    with Sess.begin() as session:
         stmt = (
             select(Team.tid, Team.abbr, func.round(func.avg(TeamStat.sog), 2).label("avg_sog"))
             .join(TeamStat, Team.tid == TeamStat.tid)
@@ -50,3 +52,90 @@ def avg_team_sog():
         output = session.execute(stmt).all()
         for row in output:
             print(row.abbr, row.avg_sog)
+
+
+# Directory of handwritten SQL queries (psql/<topic>/<query>.sql)
+PSQL_DIR = Path(__file__).parent / "psql"
+
+
+def sql_files() -> List[Path]:
+    """Paths of all SQL queries sorted by topic and name."""
+    return sorted(PSQL_DIR.glob("*/*.sql"))
+
+
+def read_sql_file(path: Path) -> str:
+    """Text of SQL query without trailing semicolon (e.g. to be wrapped by EXPLAIN)."""
+    return path.read_text(encoding="utf-8").strip().rstrip(";")
+
+
+def bind_params(sql: str, params: dict) -> dict:
+    """Subset of parameters used by SQL query (unused ones are ignored)."""
+    names = text(sql).compile().params
+    return {key: value for key, value in params.items() if key in names}
+
+
+def run_sql_file(path: Path, **params) -> list:
+    """Run SQL query with bind parameters (e.g. last_n=10, team_id=1)."""
+    sql = read_sql_file(path)
+    with Sess.begin() as session:
+        return session.execute(text(sql), bind_params(sql, params)).all()
+
+
+# Columns of player overviews (player_lg_all.sql, player_lg_home.sql and
+# player_lg_away.sql)
+OVERVIEW_COLUMNS = {
+    "all": [
+        "pid", "tid", "name",
+        "sog_avg", "mode_sog", "min_sog", "max_sog",
+        "pts_avg", "mode_pts",
+        "g_avg", "mode_g", "ppg_avg", "mode_ppg",
+        "a_avg", "mode_a", "ppa_avg", "mode_ppa",
+        "pm_avg", "mode_pm",
+    ],
+    "home": [
+        "pid", "tid", "name",
+        "sog_avg", "min_sog", "max_sog", "mode_sog",
+        "pts_avg", "min_pts", "mode_pts",
+        "g_avg", "mode_g", "ppg_avg", "mode_ppg",
+        "a_avg", "mode_a", "ppa_avg", "mode_ppa",
+        "pm_avg", "mode_pm",
+    ],
+}
+OVERVIEW_COLUMNS["away"] = OVERVIEW_COLUMNS["home"]
+
+
+def player_overview(last_n: int = 10, order_by: str = "sog_avg") -> dict:
+    """All, home and away overviews of players within their last N games.
+
+    All three overviews are computed by a single query
+    (player_lg_splits.sql), so skater_stat table is read only once.
+
+    Parameters
+    ----------
+    last_n: int = 10
+        An integer representing number of last games (all, home or away)
+        of each player.
+    order_by: str = "sog_avg"
+        A string representing column the overviews are sorted by
+        (descending).
+
+    Returns
+    -------
+    dict
+        A dictionary where keys are "all", "home" and "away" and values
+        are pandas DataFrames with columns of player_lg_all.sql,
+        player_lg_home.sql and player_lg_away.sql.
+    """
+    rows = run_sql_file(PSQL_DIR / "overview" / "player_lg_splits.sql", last_n=last_n)
+    df = pd.DataFrame([row._asdict() for row in rows])
+
+    overviews = {}
+    for split, columns in OVERVIEW_COLUMNS.items():
+        df_split = df[df["split"] == split] if len(df) else pd.DataFrame(columns=columns)
+        overviews[split] = (
+            df_split[columns]
+            .sort_values(order_by, ascending=False)
+            .reset_index(drop=True)
+        )
+
+    return overviews
@@ -1,21 +1,61 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, Engine
 from sqlalchemy.orm import sessionmaker, Session
 
-from config import DATABASE_URL
+from config import (
+    DATABASE_URL,
+    DB_POOL_SIZE,
+    DB_MAX_OVERFLOW,
+    DB_POOL_PRE_PING,
+    DB_POOL_RECYCLE,
+)
 
 
-# Check if DATABASE_URL is not None before setting engine
-db_url = []
-if DATABASE_URL:
-    db_url.append(DATABASE_URL)
+# Engine is created on first use (importing modules does not require database)
+_engine = {}
 
-# Create engine
-# Establishing a connection to the database and provide the interface for issuing SQL statements
-engine = create_engine(db_url[0])
 
-# This session is bound to the engine and can be used to interact with the database (querying and committing transactions)
-session = Session(engine)
+def get_engine() -> Engine:
+    """Engine of the project database.
+
+    Engine is created on the first call only. Connections are pooled,
+    checked before use (pre-ping) and replaced when they are older
+    than DB_POOL_RECYCLE seconds.
+
+    Returns
+    -------
+    Engine
+        Engine providing the interface for issuing SQL statements.
+
+    Raises
+    ------
+    RuntimeError
+        If DEVELOPMENT_DATABASE_URL environment variable is not set.
+    """
+    if "engine" not in _engine:
+        if not DATABASE_URL:
+            raise RuntimeError(
+                "Database is not configured, set DEVELOPMENT_DATABASE_URL variable "
+                "(e.g. within .env file)."
+            )
+
+        _engine["engine"] = create_engine(
+            DATABASE_URL,
+            pool_size=DB_POOL_SIZE,
+            max_overflow=DB_MAX_OVERFLOW,
+            pool_pre_ping=DB_POOL_PRE_PING,
+            pool_recycle=DB_POOL_RECYCLE,
+        )
+
+    return _engine["engine"]
+
+
+class LazySession(Session):
+    """Session bound to the engine created on first database access."""
+
+    def get_bind(self, *args, **kwargs) -> Engine:
+        return get_engine()
+
 
-# Bind the engine to a session
 # Create a configurable session factory (create a new Session isntances when needed)
-Sess = sessionmaker(engine)
+# Each 'with Sess.begin() as session' block is a single unit of work
+Sess = sessionmaker(class_=LazySession)
@@ -0,0 +1,4 @@
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers", "integration: test needs PostgreSQL database (DEVELOPMENT_DATABASE_URL)"
+    )
@@ -0,0 +1,21 @@
+from src.data_preprocessing import game_data
+from src.data_preprocessing.game_data import GameIndex, boxscore_link
+
+
+def test_scraping_links_returns_one_link_per_game_in_gid_order(monkeypatch):
+    # Index filled by add() only, database is not loaded
+    index = GameIndex()
+    index.loaded = True
+    monkeypatch.setattr(game_data, "game_index", index)
+
+    # Games added out of gid order, two games of the same date
+    index.add(3, "2023-10-12", 1, 2, "BOS")
+    index.add(1, "2023-10-10", 3, 4, "TOR")
+    index.add(2, "2023-10-10", 5, 6, "BUF")
+
+    assert game_data.scraping_links() == [
+        boxscore_link("20231010", "TOR"),
+        boxscore_link("20231010", "BUF"),
+        boxscore_link("20231012", "BOS"),
+    ]
+    assert [row[0] for row in game_data.scraping_data()] == [1, 2, 3]
@@ -0,0 +1,51 @@
+import datetime
+
+import pandas as pd
+import pytest
+
+from config import DATABASE_URL
+from src.database.benchmark import check_team_last_win, reference_team_last_win
+
+
+def test_reference_team_last_win_averages_last_games_by_date():
+    # Game 5 is the latest one although it has the lowest gid (backfill)
+    df_games = pd.DataFrame(
+        [
+            (10, datetime.date(2023, 10, 10), 2, 1),
+            (11, datetime.date(2023, 10, 11), 1, 2),
+            (12, datetime.date(2023, 10, 12), 2, 1),
+            (13, datetime.date(2023, 10, 13), 1, 3),
+            (5, datetime.date(2023, 10, 14), 3, 1),
+        ],
+        columns=["gid", "date", "atid", "htid"],
+    )
+    # Away stats of team 2 in game 12 are missing
+    df_team_stats = pd.DataFrame(
+        [
+            (10, 1, 30), (10, 2, 20),
+            (11, 1, 25), (11, 2, 35),
+            (12, 1, 40),
+            (13, 1, 27), (13, 3, 33),
+            (5, 1, 31), (5, 3, 29),
+        ],
+        columns=["gid", "tid", "sog"],
+    )
+
+    reference = reference_team_last_win(df_games, df_team_stats, last_n=2)
+
+    expected = pd.DataFrame(
+        {
+            "tid": [1, 2, 3],
+            # Team 1: home games 5 and 12, away games 13 and 11
+            "avg_last_n_home_games": [(31 + 40) / 2, 35.0, 33.0],
+            # Team 2: away games 12 (no stats) and 10
+            "avg_last_n_away_games": [(27 + 25) / 2, 20.0, 29.0],
+        }
+    )
+    pd.testing.assert_frame_equal(reference, expected, check_names=False)
+
+
+@pytest.mark.integration
+@pytest.mark.skipif(DATABASE_URL is None, reason="DEVELOPMENT_DATABASE_URL is not set")
+def test_team_last_win_matches_reference():
+    assert check_team_last_win(teams=8, games=12, last_n=5)